@@ -156,6 +156,11 @@ class UserSavedJob(Base):
     
     # Relationships
     user = relationship("User", back_populates="saved_jobs")
+    
+    # Newest-first listing and keyset pagination per user
+    __table_args__ = (
+        Index('idx_saved_job_user_saved_at', 'user_id', 'saved_at', 'id'),
+    )
 
 class SearchHistory(Base):
     __tablename__ = "search_history"
@@ -182,6 +187,11 @@ class SearchHistory(Base):
     
     # Relationships
     user = relationship("User", back_populates="search_history")
+    
+    # Newest-first listing and keyset pagination per user
+    __table_args__ = (
+        Index('idx_search_history_user_searched_at', 'user_id', 'searched_at', 'id'),
+    )
 
 class SavedSearch(Base):
     __tablename__ = "saved_searches"
@@ -427,6 +437,9 @@ class FilteredJobView(Base):
         Index('idx_user_filter_date', 'user_id', 'filter_date'),
     )
 
+# Case-insensitive company lookups (targeted scraping matches on lower(name))
+Index('idx_target_company_lower_name', func.lower(TargetCompany.name))
+
 def create_job_hash(title: str, company: str, location: str, job_url: str = None) -> str:
     """Create a hash for job deduplication."""
     # Keep original URL-based deduplication for exact URL matches
@@ -492,6 +505,57 @@ def create_content_hash(title: str, company: str, location: str) -> str:
 def create_tables():
     Base.metadata.create_all(bind=engine)
 
+    # Add the lower(name) expression index to existing target_companies tables
+    try:
+        from sqlalchemy import text
+        with engine.connect() as conn:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_target_company_lower_name ON target_companies (lower(name))"))
+            conn.commit()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    # Partial index for the scheduler's active-company queries (is_active filter plus the last_scraped cutoff).
+    # The predicate is spelled the way each dialect renders is_active == True so the planner can match it
+    try:
+        from sqlalchemy import text
+        active_literal = "1" if DATABASE_URL.startswith("sqlite") else "true"
+        with engine.connect() as conn:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_target_company_active_scraped "
+                f"ON target_companies (last_scraped) WHERE is_active = {active_literal}"
+            ))
+            conn.commit()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    # Saved-job duplicate check filters on JSON fields. PostgreSQL gets expression indexes for them;
+    # SQLite can't match its bound JSON paths against an index and relies on idx_saved_job_user_saved_at
+    if not DATABASE_URL.startswith("sqlite"):
+        try:
+            from sqlalchemy import text
+            with engine.connect() as conn:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_saved_job_user_url "
+                    "ON user_saved_jobs (user_id, (job_data->>'job_url'))"
+                ))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS idx_saved_job_user_title_company "
+                    "ON user_saved_jobs (user_id, (job_data->>'title'), (job_data->>'company'))"
+                ))
+                conn.commit()
+        except Exception as e:
+            print(f"Migration note: {e}")
+
+    # Listing/keyset indexes for tables created before they were declared
+    try:
+        from sqlalchemy import text
+        with engine.connect() as conn:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_saved_job_user_saved_at ON user_saved_jobs (user_id, saved_at, id)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_search_history_user_searched_at ON search_history (user_id, searched_at, id)"))
+            conn.commit()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
     # Add content_hash column to existing scraped_jobs table if it doesn't exist
     try:
         from sqlalchemy import text
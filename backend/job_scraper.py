@@ -6,6 +6,8 @@ deduplication, and storage in the local database.
 """
 
 import asyncio
+import os
+import threading
 import time
 import re
 from datetime import datetime, timedelta, timezone
@@ -37,6 +39,54 @@ class JobScrapingService:
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         })
+
+        # Cap concurrent JobSpy calls per job board and retry rate-limit/connection failures
+        self.max_concurrent_per_site = int(os.getenv("SCRAPER_MAX_CONCURRENT_PER_SITE", "16"))
+        self.max_scrape_retries = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
+        self.retry_base_delay = 2.0  # seconds, doubled on each retry
+        self._site_limits = {}
+        self._site_limits_lock = threading.Lock()
+
+        # How many companies a bulk scrape works on at once (each still goes through the site limits)
+        self.max_concurrent_companies = max(1, int(os.getenv("AUTO_SCRAPING_CONCURRENCY", "4")))
+
+    def _site_limit(self, site: str) -> threading.BoundedSemaphore:
+        """Get the concurrency limiter shared by every scrape against one job board."""
+        with self._site_limits_lock:
+            if site not in self._site_limits:
+                self._site_limits[site] = threading.BoundedSemaphore(self.max_concurrent_per_site)
+            return self._site_limits[site]
+
+    def _is_retryable_scrape_error(self, error: Exception) -> bool:
+        """Rate limiting and dropped connections are worth retrying; anything else is not."""
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        message = str(error).lower()
+        return '429' in message or 'too many requests' in message or 'rate limit' in message
+
+    def _scrape_jobs_limited(self, site_name: List[str], **kwargs) -> pd.DataFrame:
+        """
+        Call JobSpy while holding a slot for each requested site, retrying with
+        exponential backoff on 429s and connection errors. Runs in a worker thread
+        (via asyncio.to_thread), so the limits hold across every event loop.
+        """
+        # Acquire in a fixed order so overlapping multi-site calls can't deadlock
+        limits = [self._site_limit(site) for site in sorted(set(site_name))]
+        for attempt in range(self.max_scrape_retries + 1):
+            for limit in limits:
+                limit.acquire()
+            try:
+                return scrape_jobs(site_name=site_name, **kwargs)
+            except Exception as e:
+                if attempt == self.max_scrape_retries or not self._is_retryable_scrape_error(e):
+                    raise
+                delay = self.retry_base_delay * (2 ** attempt)
+                print(f"  ⏳ Rate limited or connection error ({e}) - retrying in {delay:.0f}s")
+            finally:
+                for limit in reversed(limits):
+                    limit.release()
+            # Back off without holding the site slots
+            time.sleep(delay)
     
     def extract_experience_years(self, description: str) -> Tuple[Optional[int], Optional[int]]:
         """Extract minimum and maximum years of experience from job description."""
@@ -615,6 +665,7 @@ class JobScrapingService:
         filtered_jobs = []
         excluded_titles = ["president", "director", "VP", "chief", "ceo", "cto", "cfo"]
         min_relevance_score = 60  # Same threshold used in later filtering
+        now_epoch = time.time()  # One clock read for the whole batch's recency scoring
 
         for job in jobs_data:
             # Check title exclusions first (fastest filter)
@@ -637,7 +688,8 @@ class JobScrapingService:
             scoring_result = temp_scheduler.calculate_multi_keyword_score(
                 job_dict,
                 search_terms,
-                expected_salary=None
+                expected_salary=None,
+                now_epoch=now_epoch
             )
 
             # Only keep jobs that meet minimum relevance threshold
@@ -716,7 +768,7 @@ class JobScrapingService:
                     
                     # Call JobSpy
                     jobs_df = await asyncio.to_thread(
-                        scrape_jobs,
+                        self._scrape_jobs_limited,
                         site_name=sites,
                         search_term=full_search_term,
                         location=location,
@@ -969,10 +1021,9 @@ class JobScrapingService:
         all_company_analytics = {}
         
         try:
+            # Get or create every target company up front, so the session is only used from this coroutine
+            target_companies = {}
             for company_name in request.company_names:
-                print(f"\n🏢 Processing company: {company_name}")
-                
-                # Get or create target company
                 target_company = db.query(TargetCompany).filter(
                     TargetCompany.name.ilike(f"%{company_name}%")
                 ).first()
@@ -987,45 +1038,65 @@ class JobScrapingService:
                     )
                     db.add(target_company)
                     db.commit()
-                
-                # Scrape jobs for this company
-                jobs, company_analytics = await self.scrape_company_jobs(
-                    company_name=company_name,
-                    search_terms=request.search_terms,
-                    sites=request.sites,
-                    locations=request.locations,
-                    results_wanted=request.results_per_company,
-                    hours_old=request.hours_old,
-                    comprehensive_terms=getattr(request, 'comprehensive_terms', None)
-                )
-                
-                # Store analytics for this company
-                all_company_analytics[company_name] = company_analytics
-                
-                if jobs:
-                    # Store jobs in database
-                    new_jobs, duplicates = self.store_jobs_in_database(
-                        jobs=jobs,
-                        db=db,
-                        target_company_id=target_company.id,
-                        scraping_run_id=scraping_run.id
+                target_companies[company_name] = target_company
+
+            # Scrape several companies at once - the JobSpy calls themselves run in worker threads
+            company_slots = asyncio.Semaphore(self.max_concurrent_companies)
+
+            async def scrape_company(company_name):
+                async with company_slots:
+                    print(f"\n🏢 Processing company: {company_name}")
+                    jobs, company_analytics = await self.scrape_company_jobs(
+                        company_name=company_name,
+                        search_terms=request.search_terms,
+                        sites=request.sites,
+                        locations=request.locations,
+                        results_wanted=request.results_per_company,
+                        hours_old=request.hours_old,
+                        comprehensive_terms=getattr(request, 'comprehensive_terms', None)
                     )
+                    # Delay before this slot picks up the next company
+                    await asyncio.sleep(2)
+                    return company_name, jobs, company_analytics
+
+            tasks = [asyncio.ensure_future(scrape_company(name)) for name in request.company_names]
+            try:
+                # Store each company's jobs as soon as its scrape finishes
+                for next_done in asyncio.as_completed(tasks):
+                    company_name, jobs, company_analytics = await next_done
+                    target_company = target_companies[company_name]
                     
-                    total_jobs_found += len(jobs)
-                    total_new_jobs += new_jobs
-                    total_duplicates += duplicates
-                    
-                    # Update target company stats
-                    target_company.last_scraped = datetime.now(timezone.utc)
-                    target_company.total_jobs_found = db.query(ScrapedJob).filter(
-                        ScrapedJob.target_company_id == target_company.id,
-                        ScrapedJob.is_active == True
-                    ).count()
+                    # Store analytics for this company
+                    all_company_analytics[company_name] = company_analytics
                     
-                    db.commit()
-                
-                # Delay between companies
-                await asyncio.sleep(2)
+                    if jobs:
+                        # Store jobs in database
+                        new_jobs, duplicates = self.store_jobs_in_database(
+                            jobs=jobs,
+                            db=db,
+                            target_company_id=target_company.id,
+                            scraping_run_id=scraping_run.id
+                        )
+                        
+                        total_jobs_found += len(jobs)
+                        total_new_jobs += new_jobs
+                        total_duplicates += duplicates
+                        
+                        # Update target company stats
+                        target_company.last_scraped = datetime.now(timezone.utc)
+                        target_company.total_jobs_found = db.query(ScrapedJob).filter(
+                            ScrapedJob.target_company_id == target_company.id,
+                            ScrapedJob.is_active == True
+                        ).count()
+                        
+                        db.commit()
+            finally:
+                # Don't leave scrapes queued if storing failed part-way. Cancelling can't stop a JobSpy
+                # call already inside to_thread - that one runs to completion - so wait for every task
+                # to settle (and collect its exception) before the run is marked finished
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
             
             # Update scraping run with results
             scraping_run.status = "completed"
@@ -1191,7 +1262,7 @@ class JobScrapingService:
                         try:
                             print(f"  📍 Searching: '{full_search}' in {location}")
                             jobs_df = await asyncio.to_thread(
-                                scrape_jobs,
+                                self._scrape_jobs_limited,
                                 site_name=sites,
                                 search_term=full_search,
                                 location=location,
@@ -1596,24 +1596,19 @@ async def ai_filter_jobs(request: AIFilterRequest, http_request: Request):
             print(f"Filter criteria: {request.filter_criteria}")
         
         # Step 1: Analyze each job with AI
-        analysis_tasks = [
-            analyze_job_with_ai(job, request.analysis_prompt, i, client)
-            for i, job in enumerate(request.jobs)
-        ]
-        
-        # Process in batches to avoid rate limits (adjust batch size as needed)
-        batch_size = 5
-        analyzed_jobs = []
-        
-        for i in range(0, len(analysis_tasks), batch_size):
-            batch = analysis_tasks[i:i + batch_size]
-            batch_results = await asyncio.gather(*batch)
-            analyzed_jobs.extend(batch_results)
-            
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(analysis_tasks):
-                await asyncio.sleep(1)
-        
+        # Keep a fixed number of requests in flight instead of lockstep batches,
+        # so one slow response doesn't hold up the rest (results stay in order)
+        from scheduler import AI_MAX_CONCURRENCY
+        ai_slots = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+        async def analyze_limited(i: int, job: Dict[str, Any]) -> AIAnalysisResult:
+            async with ai_slots:
+                return await analyze_job_with_ai(job, request.analysis_prompt, i, client)
+
+        analyzed_jobs = list(await asyncio.gather(
+            *(analyze_limited(i, job) for i, job in enumerate(request.jobs))
+        ))
+
         print(f"Completed analysis of {len(analyzed_jobs)} jobs")
         
         # Step 2: Apply filtering if criteria provided
@@ -1683,11 +1678,12 @@ async def save_job_for_user(
 async def get_user_saved_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last job on the previous page"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get saved jobs for the authenticated user"""
-    saved_jobs = UserService.get_saved_jobs(db, current_user.id, skip, limit)
+    saved_jobs = UserService.get_saved_jobs(db, current_user.id, skip, limit, after_id)
     return {
         "success": True,
         "message": f"Retrieved {len(saved_jobs)} saved jobs",
@@ -1755,11 +1751,12 @@ async def delete_user_saved_job(
 async def get_user_search_history(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last entry on the previous page"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get search history for the authenticated user"""
-    search_history = UserService.get_search_history(db, current_user.id, skip, limit)
+    search_history = UserService.get_search_history(db, current_user.id, skip, limit, after_id)
     return {
         "success": True,
         "message": f"Retrieved {len(search_history)} search history entries",
@@ -3153,6 +3150,10 @@ async def save_scraping_defaults_public(defaults_data: ScrapingDefaultsCreate):
         
         with open(defaults_file, 'w') as f:
             json.dump(data, f, indent=2)
+
+        # Make the scheduler pick up the new defaults on its next read
+        from scheduler import invalidate_config_cache
+        invalidate_config_cache()
         
         # Build response message
         updated_fields = []
@@ -3886,6 +3887,8 @@ async def run_autoscraping_now(config: dict, current_user: User = Depends(get_cu
                         user_id=current_user.id
                     )
                 )
+                # Let the results email go out before the loop is dropped
+                loop.run_until_complete(scheduler.wait_for_notifications())
             except Exception as e:
                 print(f"Error in background scraping: {e}")
 
@@ -4115,6 +4118,7 @@ async def process_existing_scraped_jobs(
         # Convert to DataFrame and calculate relevance scores
         jobs_data = []
         search_terms = ["software engineer", "product manager", "developer", "engineer"]  # Default search terms
+        now_epoch = time.time()  # One clock read for the whole batch's recency scoring
         
         for job in scraped_jobs:
             # Calculate relevance score for each search term
@@ -4134,16 +4138,10 @@ async def process_existing_scraped_jobs(
             }
             
             # Calculate relevance score using the best matching search term
-            best_score = 0
-            best_keyword = ""
-            for search_term in search_terms:
-                score = scheduler.calculate_relevance_score(job_dict, search_term)
-                if score > best_score:
-                    best_score = score
-                    best_keyword = search_term
-            
-            # Get AI relevance evaluation
-            ai_relevance = scheduler.evaluate_job_relevance_with_ai(job.title, job.description)
+            # (stops trying terms once one scores EARLY_EXIT_SCORE)
+            scoring_result = scheduler.calculate_multi_keyword_score(job_dict, search_terms, now_epoch=now_epoch)
+            best_score = scoring_result['score']
+            best_keyword = scoring_result['best_keyword']
             
             jobs_data.append({
                 'Title': job.title,
@@ -4160,10 +4158,18 @@ async def process_existing_scraped_jobs(
                 'Scraped_Job_ID': job.id,
                 'Scraping_Run_ID': job.scraping_run_id,
                 'Relevance_Score': best_score,
-                'Best_Matching_Keyword': best_keyword,
-                'AI_Relevance': ai_relevance
+                'Best_Matching_Keyword': best_keyword
             })
         
+        # Get AI relevance evaluations concurrently, skipping jobs the filter will drop on score anyway
+        from scheduler import MIN_RELEVANCE_FOR_AI
+        to_evaluate = [job_data for job_data in jobs_data if job_data['Relevance_Score'] >= MIN_RELEVANCE_FOR_AI]
+        ai_results = await scheduler.evaluate_jobs_relevance_batch([(job_data['Title'], job_data['Description']) for job_data in to_evaluate])
+        for job_data in jobs_data:
+            job_data['AI_Relevance'] = 'Low Relevance - Skipped'
+        for job_data, ai_relevance in zip(to_evaluate, ai_results):
+            job_data['AI_Relevance'] = ai_relevance
+        
         df = pd.DataFrame(jobs_data)
         
         # Create a temporary CSV file for processing
@@ -6,30 +6,44 @@ It runs as a background service and can be configured through environment variab
 """
 
 import asyncio
+import bisect
+import contextlib
+import hashlib
 import schedule
 import time
 import threading
+import weakref
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
 import os
 import logging
 import json
+import re
+from itertools import chain
+from collections import OrderedDict
+from functools import lru_cache
 import smtplib
 import csv
-import io
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+import socket
+import tempfile
+from email.message import EmailMessage
+from sqlalchemy import select, insert, func, or_, tuple_
 from sqlalchemy.orm import Session
 
 from database import SessionLocal, TargetCompany, ScrapingRun, UserAutoscrapingConfig, User
 from job_scraper import job_scraper
 from models import BulkScrapingRequest
 from daily_job_review import daily_job_reviewer
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import httpx
 from dotenv import load_dotenv
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:  # watchdog is optional - without it the trigger file is polled every minute
+    Observer = None
+
 # Load environment variables
 load_dotenv()
 
@@ -37,6 +51,97 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Salary match bands: a job whose salary is within _SALARY_BAND_LIMITS[i] (as a
+# fraction of the expected salary) scores _SALARY_BAND_SCORES[i]; anything past
+# the last limit gets the final penalty.
+_SALARY_BAND_LIMITS = (0.15, 0.25, 0.40, 0.60, 0.80)
+_SALARY_BAND_SCORES = (30, 25, 10, -15, -30, -50)
+
+# Recency bands: a job posted within _RECENCY_BAND_DAYS[i] days gets _RECENCY_BAND_SCORES[i]; older gets nothing
+_RECENCY_BAND_DAYS = (1, 3, 7, 14, 30)
+_RECENCY_BAND_SCORES = (15, 12, 8, 5, 2, 0)
+
+# AI relevance evaluation: fixed system message, prompt template and the levels the model may answer with
+_RELEVANCE_SYSTEM_MESSAGE = {"role": "system", "content": "You are a job relevance evaluator. Respond with only the exact relevance level."}
+_RELEVANCE_PROMPT = """Evaluate job relevance for product manager/engineer/software roles.
+
+{job_content}
+
+Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant, Irrelevant"""
+_RELEVANCE_LEVELS = frozenset({"Highly Relevant", "Somewhat Relevant", "Somewhat Irrelevant", "Irrelevant"})
+OPENAI_MAX_RETRIES = 2
+
+# AI relevance answers remembered per prompt (same postings come back run after run and across users)
+AI_RELEVANCE_CACHE_SIZE = 8192
+
+# Executive titles dropped from the filtered export: whole words, so e.g. "MVP" or "Chiefly" don't match,
+# but plurals and the SVP/EVP/AVP forms do
+_TITLE_EXCLUDE_RE = re.compile(r'\b(?:presidents?|directors?|[aes]?vps?|vice[- ]presidents?|chiefs?|head of)\b', re.IGNORECASE)
+
+# Jobs scoring below this are dropped by the filtered export, so they're never sent for AI evaluation
+MIN_RELEVANCE_FOR_AI = 60
+
+# OpenAI requests in flight at once (scheduler batches and the API's AI filtering share this)
+AI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "20"))
+
+# Rows per multi-row INSERT when saving FilteredJobView entries
+FILTERED_VIEW_INSERT_BATCH = 1000
+
+# filter_criteria recorded on FilteredJobView rows saved from the filtered CSV (shared by every row, never mutated)
+_CSV_FILTER_CRITERIA = {
+    "min_relevance_score": 60,
+    "ai_relevance_excluded": ["Irrelevant"],
+    "excluded_titles": ["president", "director", "VP", "chief"],
+    "enhanced_scoring": True
+}
+
+# Once a keyword scores this high, calculate_multi_keyword_score stops trying the rest
+EARLY_EXIT_SCORE = 150
+
+# Marks a job dict whose date_posted hasn't been parsed yet (None means "no usable date")
+_NOT_PARSED = object()
+
+# Words ignored when splitting a search term for relevance scoring
+_SCORING_STOP_WORDS = frozenset({'and', 'or', 'the', 'a', 'an', 'in', 'at', 'for', 'with', 'by', 'to', 'of', 'from'})
+
+@lru_cache(maxsize=64)
+def _prepare_search_term(search_term: str) -> tuple:
+    """Lowercase a search term and split out its scoring words: (search, (word, ...))."""
+    search = search_term.lower().strip()
+    return search, tuple(word for word in search.split() if len(word) > 1 and word not in _SCORING_STOP_WORDS)
+
+# Single-pass newline flattening for CSV description cells
+_NEWLINE_TRANS = str.maketrans({'\n': ' ', '\r': ''})
+
+# Manual triggers go to the scheduler's Unix socket; the trigger file is the fallback
+# for platforms without AF_UNIX or when no scheduler is listening (see trigger_manual_scraping)
+TRIGGER_SOCKET = os.path.join(tempfile.gettempdir(), "scraper.sock")
+TRIGGER_FILE = os.path.join(tempfile.gettempdir(), "trigger_scraping")
+# A trigger file that doesn't parse yet is left alone this long in case a writer is still filling it
+TRIGGER_FILE_SETTLE_SECONDS = 5
+
+# Companies scraped more recently than this are skipped by the daily run (some buffer under 24h)
+RESCRAPE_INTERVAL = timedelta(hours=23)
+
+# How long get_status reuses its active-company count (status is polled by the UI)
+ACTIVE_COMPANIES_CACHE_TTL = 60
+
+# How long get_status reuses its whole result, unless the schedule changes in between
+STATUS_CACHE_TTL = 5
+
+# Config files written by the admin UI (relative to the backend working directory)
+SCRAPING_DEFAULTS_FILE = "scraping_defaults.json"
+AUTOSCRAPING_CONFIG_FILE = "autoscraping_config.json"
+
+# Parsed config files shared by every scheduler instance: filename -> (mtime_ns, data)
+_config_cache: Dict[str, tuple] = {}
+_config_cache_lock = threading.Lock()
+
+def invalidate_config_cache():
+    """Forget cached config files so the next read picks up changes from disk."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
 class AutoScrapingScheduler:
     """Handles automatic daily job scraping for target companies."""
     
@@ -44,6 +149,17 @@ class AutoScrapingScheduler:
         self.job_scraper = job_scraper  # Use the global instance
         self.is_running = False
         self.scheduler_thread = None
+        self.loop = None  # Event loop the scheduled runs execute on (owned by scheduler_thread)
+        self._scheduler_future = None
+        self._tasks = set()
+        self._notify_tasks = set()  # completion notifications still being sent
+        self._schedule_changed_at = time.monotonic()
+        self._next_run_cache = None  # (next_run, computed_at)
+        self._active_companies_count_cache = None  # (computed_at, count) for get_status
+        self._status_cache = None  # (computed_at, status dict) for get_status
+        self._trigger_observer = None  # watchdog observer for TRIGGER_FILE, when available
+        self._trigger_server = None  # Unix socket server for TRIGGER_SOCKET, when supported
+        self._trigger_socket_inode = None  # inode of the socket file our server created
         
         # Configuration from environment variables
         self.enabled = os.getenv("AUTO_SCRAPING_ENABLED", "true").lower() == "true"
@@ -67,9 +183,24 @@ class AutoScrapingScheduler:
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.openai_model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
         self.openai_client = None
+        self.ai_max_concurrency = AI_MAX_CONCURRENCY
+        self.ai_request_timeout = 30
+        self._ai_relevance_cache = OrderedDict()  # sha1(prompt) -> relevance level, LRU order
+        self._ai_relevance_cache_lock = threading.Lock()  # batches run on a worker thread's loop
+        self._async_openai_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncOpenAI (its pool is tied to that loop)
+        self._async_openai_clients_lock = threading.Lock()
+        self._ai_thread_state = threading.local()  # per-thread event loop for evaluate_jobs_relevance
         if self.openai_api_key and self.openai_api_key != "your_openai_api_key_here":
             try:
-                self.openai_client = OpenAI(api_key=self.openai_api_key)
+                # Explicit keep-alive pool so back-to-back evaluations reuse connections instead of new TLS handshakes
+                self.openai_client = OpenAI(
+                    api_key=self.openai_api_key,
+                    max_retries=OPENAI_MAX_RETRIES,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+                        timeout=self.ai_request_timeout
+                    )
+                )
                 logger.info("OpenAI client initialized for AI relevance evaluation")
             except Exception as e:
                 logger.warning(f"Failed to initialize OpenAI client: {e}")
@@ -78,227 +209,248 @@ class AutoScrapingScheduler:
 
         logger.info(f"AutoScrapingScheduler ready - {'Enabled' if self.enabled else 'Disabled'} at {self.schedule_time}")
     
-    def get_active_companies(self) -> List[TargetCompany]:
-        """Get target companies for scraping based on saved defaults or all active companies."""
-        db = SessionLocal()
+    def get_active_companies(self, scraped_before: Optional[datetime] = None, db: Optional[Session] = None) -> List[TargetCompany]:
+        """
+        Get target companies for scraping based on saved defaults or all active companies.
+
+        With scraped_before, companies last scraped at or after that time are left out
+        (filtered in SQL for the all-companies case). Pass the run's session as db to keep
+        the returned companies attached to it; otherwise a short-lived session is used.
+        """
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
         try:
             # First, try to load companies from scraping defaults
             default_companies = self._get_default_company_names()
             
             if default_companies:
-                # Use specific companies from defaults
+                # Use specific companies from defaults, matched locally against one fetch of the active companies
+                active_companies = db.query(TargetCompany).filter(TargetCompany.is_active == True).all()
+                by_lower_name = {}
+                for company in active_companies:
+                    by_lower_name.setdefault(company.name.lower(), company)
+
                 companies = []
+                missing_companies = []
+                recently_scraped = 0
                 for company_name in default_companies:
-                    # Try exact match first
-                    company = db.query(TargetCompany).filter(
-                        TargetCompany.name.ilike(company_name),
-                        TargetCompany.is_active == True
-                    ).first()
+                    # Try exact match first (case-insensitive)
+                    name_lower = company_name.lower()
+                    company = by_lower_name.get(name_lower)
                     
                     # If not found, try partial match
                     if not company:
-                        company = db.query(TargetCompany).filter(
-                            TargetCompany.name.ilike(f"%{company_name}%"),
-                            TargetCompany.is_active == True
-                        ).first()
+                        company = next((c for c in active_companies if name_lower in c.name.lower()), None)
                     
                     if company:
+                        if scraped_before and self._scraped_since(company, scraped_before):
+                            recently_scraped += 1
+                            logger.info("Company '%s' was scraped recently - skipping", company.name)
+                            continue
                         companies.append(company)
-                        logger.info(f"✅ Found target company: {company.name}")
+                        logger.info("✅ Found target company: %s", company.name)
                     else:
-                        # Auto-create missing company
-                        logger.info(f"🔧 Company '{company_name}' not found in database, creating it automatically...")
-                        new_company = self._create_target_company(db, company_name)
-                        if new_company:
-                            companies.append(new_company)
-                            logger.info(f"✅ Created and added target company: {new_company.name}")
-                        else:
-                            logger.warning(f"❌ Failed to create company: {company_name}")
+                        missing_companies.append(company_name)
+
+                if missing_companies:
+                    # Auto-create missing companies in one INSERT
+                    logger.info(f"🔧 {len(missing_companies)} companies not found in database, creating them automatically...")
+                    new_companies = self._create_target_companies(db, missing_companies)
+                    if new_companies:
+                        companies.extend(new_companies)
+                        logger.info(f"✅ Created and added {len(new_companies)} target companies")
+                    else:
+                        logger.warning(f"❌ Failed to create companies: {', '.join(missing_companies)}")
                 
-                if companies:
+                if companies or recently_scraped:
                     logger.info(f"🎯 Using {len(companies)} specific target companies from defaults")
                     return companies
                 else:
                     logger.warning("❌ No valid companies found from defaults, falling back to all companies")
             
             # Fallback: use all active companies
-            companies = db.query(TargetCompany).filter(
-                TargetCompany.is_active == True
-            ).all()
+            query = db.query(TargetCompany).filter(TargetCompany.is_active == True)
+            if scraped_before:
+                query = query.filter(or_(
+                    TargetCompany.last_scraped.is_(None),
+                    TargetCompany.last_scraped < scraped_before
+                ))
+            companies = query.all()
             logger.info(f"Found {len(companies)} active target companies (using all companies)")
             return companies
         finally:
-            db.close()
+            if own_session:
+                db.close()
     
+    def _read_json_file(self, filename: str) -> dict:
+        """
+        Read a JSON config file, returning an empty dict if it is missing or unreadable.
+        The parsed file is cached until its mtime changes; treat the returned dict as read-only.
+        """
+        try:
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            mtime_ns = None  # missing file
+
+        with _config_cache_lock:
+            cached = _config_cache.get(filename)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+
+            data = {}
+            if mtime_ns is not None:
+                try:
+                    with open(filename, 'r') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.error("Error reading %s: %s", filename, e)
+
+            _config_cache[filename] = (mtime_ns, data)
+            return data
+
+    def _scraping_defaults(self) -> dict:
+        """Parsed scraping_defaults.json (cached, read-only)."""
+        return self._read_json_file(SCRAPING_DEFAULTS_FILE)
+
+    def _autoscraping_config(self) -> dict:
+        """Parsed autoscraping_config.json - the UI settings (cached, read-only)."""
+        return self._read_json_file(AUTOSCRAPING_CONFIG_FILE)
+
     def _get_default_company_names(self) -> List[str]:
         """Get default company names from scraping defaults file."""
-        try:
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    companies = data.get('companies', [])
-                    if companies:
-                        logger.info(f"📋 Loaded {len(companies)} default companies: {', '.join(companies)}")
-                        return companies
-        except Exception as e:
-            logger.error(f"Error loading default companies: {e}")
-        
+        companies = self._scraping_defaults().get('companies', [])
+        if companies:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 Loaded %d default companies: %s", len(companies), ', '.join(companies))
+            return companies
         return []
     
-    def _create_target_company(self, db: Session, company_name: str) -> Optional[TargetCompany]:
-        """Create a new target company in the database with sensible defaults."""
+    def _create_target_companies(self, db: Session, company_names: List[str]) -> List[TargetCompany]:
+        """Create target companies with sensible defaults in one INSERT, committing once."""
+        # One row per name, ignoring case differences between the requested names
+        names = list(dict.fromkeys(company_name.title() for company_name in company_names))
+        if not names:
+            return []
+
         try:
-            # Get default search terms from config
             default_search_terms = self._get_default_search_terms()
-            
-            # Create new company with intelligent defaults
-            new_company = TargetCompany(
-                name=company_name.title(),  # Capitalize properly
-                display_name=company_name.title(),
-                preferred_sites=["indeed", "linkedin", "glassdoor"],
-                search_terms=default_search_terms,
-                location_filters=["USA", "United States"],
-                is_active=True
-            )
-            
-            db.add(new_company)
+            new_companies = db.scalars(
+                insert(TargetCompany).returning(TargetCompany),
+                [
+                    {
+                        "name": name,
+                        "display_name": name,
+                        "preferred_sites": ["indeed", "linkedin", "glassdoor"],
+                        "search_terms": default_search_terms,
+                        "location_filters": ["USA", "United States"],
+                        "is_active": True
+                    }
+                    for name in names
+                ]
+            ).all()
             db.commit()
-            db.refresh(new_company)
-            
-            logger.info(f"🏢 Auto-created target company: {new_company.name}")
-            logger.info(f"   Search terms: {new_company.search_terms}")
-            logger.info(f"   Sites: {new_company.preferred_sites}")
-            
-            return new_company
-            
+            self._active_companies_count_cache = None
+
+            logger.info(f"🏢 Auto-created {len(new_companies)} target companies: {', '.join(names)}")
+            return new_companies
+
         except Exception as e:
-            logger.error(f"Failed to create target company '{company_name}': {e}")
+            logger.error(f"Failed to create target companies {names}: {e}")
             db.rollback()
-            return None
-    
+            return []
+
     def _get_default_hours_old(self) -> int:
         """Get default hours_old from scraping defaults file."""
-        try:
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    hours_old = data.get('hours_old')
-                    if hours_old:
-                        logger.info(f"⏰ Loaded default hours_old: {hours_old} hours ({hours_old/24:.1f} days)")
-                        return hours_old
-        except Exception as e:
-            logger.error(f"Error loading default hours_old: {e}")
-        
+        hours_old = self._scraping_defaults().get('hours_old')
+        if hours_old:
+            logger.debug("⏰ Loaded default hours_old: %s hours (%.1f days)", hours_old, hours_old / 24)
+            return hours_old
+
         # Default fallback
         return 168  # 7 days
     
     def _get_default_results_per_company(self) -> int:
         """Get default results_per_company from scraping defaults file."""
-        try:
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    results = data.get('results_per_company')
-                    if results:
-                        logger.info(f"🔢 Loaded default results_per_company: {results}")
-                        return results
-        except Exception as e:
-            logger.error(f"Error loading default results_per_company: {e}")
-        
+        results = self._scraping_defaults().get('results_per_company')
+        if results:
+            logger.debug("🔢 Loaded default results_per_company: %s", results)
+            return results
+
         # Fallback to environment variable or default
         return self.max_results_per_company
 
     def _get_default_location(self) -> str:
         """Get default location from autoscraping config file."""
-        try:
-            # First try autoscraping config file (UI settings)
-            config_file = "autoscraping_config.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                    location = data.get('location')
-                    if location:
-                        logger.info(f"📍 Loaded default location: {location}")
-                        return location
-
-            # Fallback to scraping defaults file
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    locations = data.get('locations')
-                    if locations and isinstance(locations, list) and locations:
-                        location = locations[0]  # Use first location
-                        logger.info(f"📍 Loaded fallback location: {location}")
-                        return location
-        except Exception as e:
-            logger.error(f"Error loading default location: {e}")
+        # First try autoscraping config file (UI settings)
+        location = self._autoscraping_config().get('location')
+        if location:
+            logger.debug("📍 Loaded default location: %s", location)
+            return location
+
+        # Fallback to scraping defaults file
+        locations = self._scraping_defaults().get('locations')
+        if locations and isinstance(locations, list):
+            location = locations[0]  # Use first location
+            logger.debug("📍 Loaded fallback location: %s", location)
+            return location
 
         # Default fallback
         return "USA"
 
     def _get_default_distance(self) -> int:
         """Get default distance from autoscraping config file."""
-        try:
-            # First try autoscraping config file (UI settings)
-            config_file = "autoscraping_config.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                    distance = data.get('distance')
-                    if distance:
-                        logger.info(f"🎯 Loaded default distance: {distance} miles")
-                        return distance
-        except Exception as e:
-            logger.error(f"Error loading default distance: {e}")
+        distance = self._autoscraping_config().get('distance')
+        if distance:
+            logger.debug("🎯 Loaded default distance: %s miles", distance)
+            return distance
 
         # Default fallback
         return 25
 
     def _get_scoring_config(self) -> dict:
         """Get scoring configuration from scraping defaults file."""
-        try:
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Support both single keyword (backward compatibility) and multiple keywords
-                    keywords = []
-                    if 'scoring_keywords' in data and isinstance(data['scoring_keywords'], list):
-                        keywords = [kw.strip() for kw in data['scoring_keywords'] if kw.strip()]
-                    elif 'scoring_keyword' in data and data['scoring_keyword']:
-                        keywords = [data['scoring_keyword'].strip()]
-                    
-                    config = {
-                        'scoring_keywords': keywords,
-                        'expected_salary': data.get('expected_salary', 0)
-                    }
-                    logger.info(f"🔧 Loaded scoring config: keywords={keywords}, salary={config['expected_salary']}")
-                    return config
-        except Exception as e:
-            logger.error(f"Error loading scoring config: {e}")
-        
-        return {'scoring_keywords': [], 'expected_salary': 0}
+        data = self._scraping_defaults()
+        if not data:
+            return {'scoring_keywords': [], 'expected_salary': 0}
+
+        # Support both single keyword (backward compatibility) and multiple keywords
+        keywords = []
+        if 'scoring_keywords' in data and isinstance(data['scoring_keywords'], list):
+            keywords = [kw.strip() for kw in data['scoring_keywords'] if kw.strip()]
+        elif 'scoring_keyword' in data and data['scoring_keyword']:
+            keywords = [data['scoring_keyword'].strip()]
+
+        config = {
+            'scoring_keywords': keywords,
+            'expected_salary': data.get('expected_salary', 0)
+        }
+        logger.debug("🔧 Loaded scoring config: keywords=%s, salary=%s", keywords, config['expected_salary'])
+        return config
     
-    def calculate_relevance_score(self, job: Dict[str, Any], search_term: str, expected_salary: int = None) -> int:
-        """Calculate job relevance score using the same logic as the main app."""
+    def calculate_relevance_score(self, job: Dict[str, Any], search_term: str, expected_salary: int = None, now_epoch: float = None,
+                                  description_counts: Optional[Dict[str, int]] = None, job_bonus: Optional[int] = None,
+                                  job_text: Optional[tuple] = None) -> int:
+        """Calculate job relevance score using the same logic as the main app.
+
+        Pass now_epoch (time.time()) when scoring a batch so the recency bonus
+        doesn't resolve the current time for every job. description_counts is an
+        optional per-job memo of word -> occurrences in the description, shared
+        across keywords so a word common to several terms is only counted once.
+        job_bonus is the keyword-independent part from _job_bonus_score, and job_text the
+        lowercased fields from _prepare_job_text, if already known.
+        """
         score = 0
         if not search_term or not search_term.strip():
             return 0
         
         # Get job details
-        title = (job.get('title', '') or '').lower().strip()
-        description = (job.get('description', '') or '').lower().strip()
-        company = (job.get('company', '') or '').lower().strip()
-        search = search_term.lower().strip()
+        if job_text is None:
+            job_text = self._prepare_job_text(job)
+        title, title_words, description, company, job_type = job_text
         
-        # Split search term into words, filter out common stop words
-        stop_words = {'and', 'or', 'the', 'a', 'an', 'in', 'at', 'for', 'with', 'by', 'to', 'of', 'from'}
-        search_words = [word for word in search.split() if len(word) > 1 and word not in stop_words]
+        # Split search term into words, filter out common stop words (cached per term)
+        search, search_words = _prepare_search_term(search_term)
         
         if not search_words:
             return 0
@@ -312,7 +464,6 @@ class AutoScrapingScheduler:
             score += 80
         
         # 3. All search words in title (high score)
-        title_words = title.split()
         title_words_matched = [sw for sw in search_words if any(sw in tw or tw in sw for tw in title_words)]
         
         if len(title_words_matched) == len(search_words):
@@ -332,8 +483,12 @@ class AutoScrapingScheduler:
         
         # 5. Description matches (lower weight)
         if description:
+            if description_counts is None:
+                description_counts = {}
             for search_word in search_words:
-                matches = description.count(search_word)
+                matches = description_counts.get(search_word)
+                if matches is None:
+                    matches = description_counts[search_word] = description.count(search_word)
                 if matches:
                     score += min(matches * 5, 20)  # Cap at 20 points per word
             
@@ -348,105 +503,104 @@ class AutoScrapingScheduler:
                     score += 5
         
         # 7. Job type matching bonus
-        job_type = (job.get('job_type', '') or '').lower()
         if job_type and (search in job_type or ('full' in job_type and 'full' in search)):
             score += 8
         
+        # 8-9. Salary match and recency don't depend on the keyword
+        if job_bonus is None:
+            job_bonus = self._job_bonus_score(job, expected_salary, now_epoch)
+        score += job_bonus
+
+        return round(score)
+
+    def _prepare_job_text(self, job: Dict[str, Any]) -> tuple:
+        """Lowercase the fields keyword scoring matches against: (title, title_words, description, company, job_type)."""
+        title = (job.get('title', '') or '').lower().strip()
+        return (
+            title,
+            title.split(),
+            (job.get('description', '') or '').lower().strip(),
+            (job.get('company', '') or '').lower().strip(),
+            (job.get('job_type', '') or '').lower()
+        )
+
+    def _job_bonus_score(self, job: Dict[str, Any], expected_salary: int = None, now_epoch: float = None) -> int:
+        """The keyword-independent part of calculate_relevance_score: salary match and recency bonus."""
+        score = 0
+
         # 8. Salary matching with rewards and penalties
         if expected_salary and expected_salary > 0:
             min_salary = job.get('min_amount')
             max_salary = job.get('max_amount')
             
-            if min_salary and max_salary:
-                # Calculate median salary for the job
-                median_job_salary = (min_salary + max_salary) / 2
-                salary_diff = abs(expected_salary - median_job_salary)
-                percentage_diff = salary_diff / expected_salary
-                
-                # Salary scoring with rewards and penalties
-                if percentage_diff <= 0.15:
-                    salary_score = 30  # Within 15% - excellent match
-                elif percentage_diff <= 0.25:
-                    salary_score = 25  # Within 25% - very good match
-                elif percentage_diff <= 0.40:
-                    salary_score = 10  # Within 40% - acceptable match
-                elif percentage_diff <= 0.60:
-                    salary_score = -15  # 40-60% - penalty for poor match
-                elif percentage_diff <= 0.80:
-                    salary_score = -30  # 60-80% - bigger penalty
-                else:
-                    salary_score = -50  # Above 80% - major penalty
-                
-                score += salary_score
-                
-            elif min_salary or max_salary:
-                # Only one salary bound available
-                available_salary = min_salary or max_salary
-                salary_diff = abs(expected_salary - available_salary)
-                percentage_diff = salary_diff / expected_salary
-                
-                # Same scoring logic for partial data
-                if percentage_diff <= 0.15:
-                    salary_score = 30
-                elif percentage_diff <= 0.25:
-                    salary_score = 25
-                elif percentage_diff <= 0.40:
-                    salary_score = 10
-                elif percentage_diff <= 0.60:
-                    salary_score = -15
-                elif percentage_diff <= 0.80:
-                    salary_score = -30
+            if min_salary or max_salary:
+                if min_salary and max_salary:
+                    # Calculate median salary for the job
+                    job_salary = (min_salary + max_salary) / 2
                 else:
-                    salary_score = -50
-                
-                score += salary_score
+                    # Only one salary bound available
+                    job_salary = min_salary or max_salary
+                percentage_diff = abs(expected_salary - job_salary) / expected_salary
+                score += _SALARY_BAND_SCORES[bisect.bisect_left(_SALARY_BAND_LIMITS, percentage_diff)]
             else:
                 # No salary data - give small bonus as neutral reward
                 score += 10
         
         # 9. Recency bonus (newer posts get higher ranking)
-        if job.get('date_posted'):
-            try:
-                from datetime import datetime
-                post_date = datetime.fromisoformat(str(job['date_posted']).replace('Z', '+00:00'))
-                now = datetime.now(post_date.tzinfo)
-                days_since_posted = (now - post_date).days
-                
-                # Recency bonus: max 15 points for posts within last week, declining over time
-                if days_since_posted <= 1:
-                    score += 15  # Posted within last day
-                elif days_since_posted <= 3:
-                    score += 12  # Posted within last 3 days
-                elif days_since_posted <= 7:
-                    score += 8   # Posted within last week
-                elif days_since_posted <= 14:
-                    score += 5   # Posted within last 2 weeks
-                elif days_since_posted <= 30:
-                    score += 2   # Posted within last month
-            except:
-                # Invalid date, skip recency bonus
-                pass
+        # The parsed timestamp is cached on the job dict so repeat calls for the same job parse once
+        posted_ts = job.get('_posted_ts', _NOT_PARSED)
+        if posted_ts is _NOT_PARSED:
+            posted_ts = None
+            date_posted = job.get('date_posted')
+            if date_posted:
+                # Invalid or out-of-range date, skip recency bonus
+                with contextlib.suppress(ValueError, TypeError, OverflowError, OSError):
+                    # Database rows already hold datetimes - only parse strings
+                    if isinstance(date_posted, datetime):
+                        posted_ts = date_posted.timestamp()
+                    else:
+                        posted_ts = datetime.fromisoformat(str(date_posted).replace('Z', '+00:00')).timestamp()
+            job['_posted_ts'] = posted_ts
+
+        if posted_ts is not None:
+            if now_epoch is None:
+                now_epoch = time.time()
+            days_since_posted = (now_epoch - posted_ts) // 86400
+            
+            # Recency bonus: max 15 points for posts within the last day, declining over the month
+            score += _RECENCY_BAND_SCORES[bisect.bisect_left(_RECENCY_BAND_DAYS, days_since_posted)]
         
-        return round(score)
+        return score
     
-    def calculate_multi_keyword_score(self, job: Dict[str, Any], keywords: List[str], expected_salary: int = None) -> Dict[str, Any]:
-        """Calculate relevance scores for multiple keywords and return the highest score."""
+    def calculate_multi_keyword_score(self, job: Dict[str, Any], keywords: List[str], expected_salary: int = None, now_epoch: float = None,
+                                      early_exit_score: Optional[int] = EARLY_EXIT_SCORE) -> Dict[str, Any]:
+        """
+        Calculate relevance scores for multiple keywords and return the highest score.
+
+        Keywords are tried shortest first, and scoring stops as soon as one reaches
+        early_exit_score (pass None to always score every keyword). Keywords that were
+        never scored show up in all_scores as None.
+        """
         if not keywords:
             logger.info("🔍 No keywords provided for scoring")
             return {'score': 0, 'best_keyword': '', 'all_scores': {}}
         
-        all_scores = {}
+        all_scores = dict.fromkeys(keyword for keyword in keywords if keyword.strip())
         best_score = 0
         best_keyword = ''
+        description_counts = {}  # same job for every keyword, so description word counts carry over
+        job_bonus = self._job_bonus_score(job, expected_salary, now_epoch)  # salary/recency part, same for every keyword
+        job_text = self._prepare_job_text(job)  # lowercased once, not once per keyword
         
-        for keyword in keywords:
-            if keyword.strip():
-                score = self.calculate_relevance_score(job, keyword.strip(), expected_salary)
-                all_scores[keyword] = score
-                
-                if score > best_score:
-                    best_score = score
-                    best_keyword = keyword
+        for keyword in sorted(all_scores, key=len):
+            score = self.calculate_relevance_score(job, keyword.strip(), expected_salary, now_epoch, description_counts, job_bonus, job_text)
+            all_scores[keyword] = score
+            
+            if score > best_score:
+                best_score = score
+                best_keyword = keyword
+            if early_exit_score is not None and score >= early_exit_score:
+                break
         
         return {
             'score': best_score,
@@ -456,18 +610,11 @@ class AutoScrapingScheduler:
     
     def _get_default_search_terms(self) -> List[str]:
         """Get default search terms from scraping defaults file."""
-        try:
-            defaults_file = "scraping_defaults.json"
-            if os.path.exists(defaults_file):
-                with open(defaults_file, 'r') as f:
-                    data = json.load(f)
-                    search_terms = data.get('search_terms', [])
-                    if search_terms:
-                        logger.info(f"📝 Loaded {len(search_terms)} default search terms: {', '.join(search_terms)}")
-                        return search_terms
-        except Exception as e:
-            logger.error(f"Error loading default search terms: {e}")
-        
+        search_terms = self._scraping_defaults().get('search_terms', [])
+        if search_terms:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📝 Loaded %d default search terms: %s", len(search_terms), ', '.join(search_terms))
+            return search_terms
         return []
 
     def evaluate_job_relevance_with_ai(self, job_title: str, job_description: str = None) -> str:
@@ -481,58 +628,194 @@ class AutoScrapingScheduler:
             return "AI Not Configured"
 
         try:
-            # Ensure job_description is a string (handle case where it might be a list)
-            if isinstance(job_description, list):
-                job_description = ' '.join(str(item) for item in job_description if item)
-            elif job_description is None:
-                job_description = ""
-            else:
-                job_description = str(job_description)
-
-            # Use description if available, otherwise fall back to title
-            content_to_analyze = job_description.strip() if job_description and job_description.strip() else job_title.strip()
-
-            if not content_to_analyze:
+            messages = self._build_relevance_messages(job_title, job_description)
+            if messages is None:
                 return "No Content"
 
-            # Create simplified prompt for GPT-5 Nano
-            job_content = f"Title: {job_title}"
-            if content_to_analyze != job_title:
-                # Truncate description to keep token usage low
-                description_short = content_to_analyze[:300]
-                job_content += f"\nDescription: {description_short}"
-
-            prompt = f"""Evaluate job relevance for product manager/engineer/software roles.
-
-{job_content}
-
-Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant, Irrelevant"""
+            cache_key = self._relevance_cache_key(messages)
+            cached = self._cached_relevance(cache_key)
+            if cached is not None:
+                return cached
 
             response = self.openai_client.chat.completions.create(
                 model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are a job relevance evaluator. Respond with only the exact relevance level."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 max_tokens=15,
                 temperature=0.1
             )
+            relevance = self._parse_relevance_response(response)
+            self._remember_relevance(cache_key, relevance)
+            return relevance
+
+        except Exception as e:
+            logger.error(f"Error in AI job relevance evaluation: {e}")
+            return "AI Error"
 
-            relevance = response.choices[0].message.content.strip()
+    def _build_relevance_messages(self, job_title: str, job_description=None) -> Optional[List[dict]]:
+        """Build the chat messages for a relevance evaluation, or None if there is nothing to evaluate."""
+        job_title = job_title or ""
 
-            # Validate response is one of the expected values
-            valid_responses = ["Highly Relevant", "Somewhat Relevant", "Somewhat Irrelevant", "Irrelevant"]
-            if relevance not in valid_responses:
-                logger.warning(f"AI returned unexpected relevance: {relevance}")
-                return "AI Error"
+        # Ensure job_description is a string (handle case where it might be a list)
+        if isinstance(job_description, list):
+            job_description = ' '.join(str(item) for item in job_description if item)
+        elif job_description is None:
+            job_description = ""
+        else:
+            job_description = str(job_description)
 
+        # Use description if available, otherwise fall back to title
+        content_to_analyze = job_description.strip() if job_description and job_description.strip() else job_title.strip()
+
+        if not content_to_analyze:
+            return None
+
+        # Create simplified prompt for GPT-5 Nano
+        job_content = f"Title: {job_title}"
+        if content_to_analyze != job_title:
+            # Truncate description to keep token usage low - the longer (more telling) the title, the less we send
+            description_short = content_to_analyze[:min(300, max(50, 400 - len(job_title) * 2))]
+            job_content += f"\nDescription: {description_short}"
+
+        return [
+            _RELEVANCE_SYSTEM_MESSAGE,
+            {"role": "user", "content": _RELEVANCE_PROMPT.format(job_content=job_content)}
+        ]
+
+    def _parse_relevance_response(self, response) -> str:
+        """Pull the relevance level out of a chat completion, validating it against the four levels."""
+        relevance = response.choices[0].message.content.strip()
+
+        # Validate response is one of the expected values
+        if relevance not in _RELEVANCE_LEVELS:
+            logger.warning(f"AI returned unexpected relevance: {relevance}")
+            return "AI Error"
+
+        return relevance
+
+    def _relevance_cache_key(self, messages: List[dict]) -> str:
+        """Cache key for a relevance prompt - the prompt is all the model sees, so equal prompts get equal answers."""
+        return hashlib.sha1(messages[-1]["content"].encode("utf-8")).hexdigest()
+
+    def _cached_relevance(self, cache_key: str) -> Optional[str]:
+        """Return a remembered relevance level for this prompt, or None."""
+        with self._ai_relevance_cache_lock:
+            relevance = self._ai_relevance_cache.get(cache_key)
+            if relevance is not None:
+                self._ai_relevance_cache.move_to_end(cache_key)
+            return relevance
+
+    def _remember_relevance(self, cache_key: str, relevance: str):
+        """Remember a valid relevance level (errors aren't cached so they get retried next time)."""
+        if relevance not in _RELEVANCE_LEVELS:
+            return
+        with self._ai_relevance_cache_lock:
+            self._ai_relevance_cache[cache_key] = relevance
+            self._ai_relevance_cache.move_to_end(cache_key)
+            if len(self._ai_relevance_cache) > AI_RELEVANCE_CACHE_SIZE:
+                self._ai_relevance_cache.popitem(last=False)
+
+    async def _evaluate_job_relevance_async(self, client: AsyncOpenAI, semaphore: asyncio.Semaphore, messages: List[dict], cache_key: str) -> str:
+        """Async version of evaluate_job_relevance_with_ai for a prepared prompt, bounded by the shared semaphore."""
+        try:
+            async with semaphore:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=self.openai_model,
+                        messages=messages,
+                        max_tokens=15,
+                        temperature=0.1
+                    ),
+                    timeout=self.ai_request_timeout
+                )
+            relevance = self._parse_relevance_response(response)
+            self._remember_relevance(cache_key, relevance)
             return relevance
 
         except Exception as e:
-            logger.error(f"Error in AI job relevance evaluation: {e}")
+            logger.error(f"Error in AI job relevance evaluation: {e!r}")
             return "AI Error"
 
-    def create_filtered_jobs_csv(self, original_csv_path: str, user_id: str = None) -> str:
+    async def evaluate_jobs_relevance_batch(self, jobs: List[tuple]) -> List[str]:
+        """
+        Evaluate many (title, description) pairs concurrently.
+
+        Up to ai_max_concurrency requests are in flight at once. Results come back
+        in the same order as the input, with the same values evaluate_job_relevance_with_ai returns.
+        Prompts answered before (or repeated within the batch) don't hit the API again.
+        """
+        if not jobs:
+            return []
+        if not self.openai_client:
+            return ["AI Not Configured"] * len(jobs)
+
+        results = [None] * len(jobs)
+        pending = {}  # cache_key -> (messages, [result indexes])
+        for i, (title, description) in enumerate(jobs):
+            messages = self._build_relevance_messages(title, description)
+            if messages is None:
+                results[i] = "No Content"
+                continue
+            cache_key = self._relevance_cache_key(messages)
+            cached = self._cached_relevance(cache_key)
+            if cached is not None:
+                results[i] = cached
+            elif cache_key in pending:
+                pending[cache_key][1].append(i)
+            else:
+                pending[cache_key] = (messages, [i])
+
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(self.ai_max_concurrency)
+        client = self._async_openai_client()
+        answers = await asyncio.gather(
+            *(self._evaluate_job_relevance_async(client, semaphore, messages, cache_key)
+              for cache_key, (messages, _) in pending.items()),
+            return_exceptions=True
+        )
+        for (_, indexes), answer in zip(pending.values(), answers):
+            for i in indexes:
+                results[i] = answer if isinstance(answer, str) else "AI Error"
+        return results
+
+    def _async_openai_client(self) -> AsyncOpenAI:
+        """
+        The AsyncOpenAI client for the running event loop, created on first use.
+
+        An httpx async pool can only be used from the loop it was created on, so there is one
+        client per loop - kept for the loop's lifetime so batches reuse keep-alive connections.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_openai_clients_lock:
+            client = self._async_openai_clients.get(loop)
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=self.openai_api_key,
+                    max_retries=OPENAI_MAX_RETRIES,
+                    http_client=httpx.AsyncClient(
+                        limits=httpx.Limits(max_connections=self.ai_max_concurrency, max_keepalive_connections=self.ai_max_concurrency, keepalive_expiry=60),
+                        timeout=self.ai_request_timeout
+                    )
+                )
+                self._async_openai_clients[loop] = client
+        return client
+
+    def evaluate_jobs_relevance(self, jobs: List[tuple]) -> List[str]:
+        """
+        Blocking wrapper around evaluate_jobs_relevance_batch for the sync CSV/filtering code.
+
+        Like asyncio.run it must not be called from a running loop - the scheduler runs those
+        methods via asyncio.to_thread. Each thread keeps one loop (instead of asyncio.run's
+        throwaway loop) so its AsyncOpenAI client and connections carry over between batches.
+        """
+        loop = getattr(self._ai_thread_state, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._ai_thread_state.loop = loop
+        return loop.run_until_complete(self.evaluate_jobs_relevance_batch(jobs))
+
+    def create_filtered_jobs_csv(self, original_csv_path: str, user_id: str = None, jobs_df=None) -> str:
         """
         Create a filtered and scored CSV based on relevance criteria.
 
@@ -545,56 +828,51 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
            - "Somewhat Relevant": +25
            - "Somewhat Irrelevant": +0
         5. Sort by final score (descending)
+
+        Pass jobs_df (same columns as the CSV) when the rows are already in memory
+        to skip reading original_csv_path back from disk.
         """
         try:
             import pandas as pd
 
-            # Read the original CSV
-            df = pd.read_csv(original_csv_path)
+            # Read the original CSV unless the caller already has its rows
+            df = jobs_df if jobs_df is not None else pd.read_csv(original_csv_path)
+
+            # Only a handful of distinct AI verdicts - as a category the filter and boost work on integer codes.
+            # assign() returns a new frame, so a passed-in jobs_df is left as the caller had it
+            df = df.assign(AI_Relevance=df['AI_Relevance'].astype('category'))
             logger.info(f"📊 Processing {len(df)} jobs for filtering...")
 
             # Initial count
             original_count = len(df)
 
+            # The three filters build one boolean mask, so the frame is sliced once at the end
+            # instead of materializing a new DataFrame per filter step
+
             # Filter 1: Remove low relevance scores (< 60)
-            df = df[df['Relevance_Score'] >= 60]
-            after_score_filter = len(df)
+            keep = (df['Relevance_Score'] >= 60).to_numpy(copy=True)  # writable - updated in place below
+            after_score_filter = int(keep.sum())
             logger.info(f"🔍 After relevance score filter (≥60): {after_score_filter} jobs remaining")
 
             # Filter 2: Remove "Irrelevant" AI evaluations
-            df = df[df['AI_Relevance'] != 'Irrelevant']
-            after_ai_filter = len(df)
+            keep &= (df['AI_Relevance'] != 'Irrelevant').to_numpy()
+            after_ai_filter = int(keep.sum())
             logger.info(f"🤖 After AI relevance filter (not Irrelevant): {after_ai_filter} jobs remaining")
 
-            # Filter 3: Exclude executive positions
-            exclusion_keywords = ['president', 'director', 'vp', 'vice president', 'chief', 'head of']
-            title_mask = True
-            for keyword in exclusion_keywords:
-                title_mask = title_mask & (~df['Title'].str.contains(keyword, case=False, na=False))
-
-            df = df[title_mask]
-            after_title_filter = len(df)
+            # Filter 3: Exclude executive positions (one precompiled regex pass, over the titles still in the running)
+            keep[keep] = ~df['Title'][keep].str.contains(_TITLE_EXCLUDE_RE, na=False).to_numpy()
+            after_title_filter = int(keep.sum())
             logger.info(f"🚫 After title exclusion filter: {after_title_filter} jobs remaining")
 
+            df = df[keep]
+
             if len(df) == 0:
                 logger.warning("⚠️ No jobs remaining after filtering!")
                 return None
 
-            # Create enhanced score based on AI relevance
-            def calculate_enhanced_score(row):
-                base_score = row['Relevance_Score']
-                ai_relevance = row['AI_Relevance']
-
-                if ai_relevance == 'Highly Relevant':
-                    return base_score + 50
-                elif ai_relevance == 'Somewhat Relevant':
-                    return base_score + 25
-                elif ai_relevance == 'Somewhat Irrelevant':
-                    return base_score  # No boost
-                else:
-                    return base_score  # For any unexpected values
-
-            df['Enhanced_Score'] = df.apply(calculate_enhanced_score, axis=1)
+            # Create enhanced score based on AI relevance (other values, incl. "Somewhat Irrelevant", get no boost)
+            ai_boost = df['AI_Relevance'].map({'Highly Relevant': 50, 'Somewhat Relevant': 25}).astype(float).fillna(0).astype(int).to_numpy()
+            df['Enhanced_Score'] = df['Relevance_Score'].to_numpy() + ai_boost
 
             # Sort by enhanced score (descending)
             df = df.sort_values('Enhanced_Score', ascending=False)
@@ -633,7 +911,7 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
             # Log top 3 jobs for preview
             logger.info(f"🏆 TOP 3 FILTERED JOBS:")
             for i, (_, job) in enumerate(df_filtered.head(3).iterrows()):
-                logger.info(f"   {i+1}. {job['Title']} at {job['Company']} (Score: {job['Enhanced_Score']:.0f})")
+                logger.info("   %d. %s at %s (Score: %.0f)", i + 1, job['Title'], job['Company'], job['Enhanced_Score'])
 
             logger.info(f"📄 Created filtered CSV: {filtered_csv_filename}")
             return filtered_csv_filename
@@ -645,15 +923,15 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
     def save_filtered_jobs_to_database(self, df_filtered, user_id: str = None):
         """Save filtered jobs to the FilteredJobView table for the UI."""
         try:
-            from database import FilteredJobView, ScrapedJob
+            from database import ScrapedJob
             from datetime import date
-            import json
 
             if not user_id:
                 logger.warning("No user_id provided for filtered jobs - skipping database save")
                 return 0
 
-            db = SessionLocal()
+            # Nothing loaded here is read back after the commit, so don't expire it
+            db = SessionLocal(expire_on_commit=False)
             try:
                 today = date.today()
                 saved_count = 0
@@ -662,63 +940,73 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
 
                 logger.info(f"💾 Saving {len(df_filtered)} filtered jobs to database...")
 
-                for _, row in df_filtered.iterrows():
+                # Pull the needed columns out once as plain Python lists (missing columns -> default)
+                def column(name, default=None):
+                    return df_filtered[name].tolist() if name in df_filtered else [default] * len(df_filtered)
+
+                rows = list(zip(
+                    column('Job_URL'), column('Title'), column('Company'),
+                    column('Relevance_Score', 0), column('Enhanced_Score', 0),
+                    column('Best_Matching_Keyword'), column('AI_Relevance')
+                ))
+
+                # Look up the matching ScrapedJobs up front instead of querying per row - just the
+                # key columns, not whole ScrapedJob objects with their descriptions
+                job_keys = (ScrapedJob.id, ScrapedJob.scraping_run_id, ScrapedJob.job_url, ScrapedJob.title, ScrapedJob.company)
+                urls = df_filtered['Job_URL'].dropna().unique().tolist() if 'Job_URL' in df_filtered else []
+                by_url = {}
+                if urls:
+                    for job in db.execute(select(*job_keys).where(ScrapedJob.job_url.in_(urls))):
+                        by_url.setdefault((job.job_url, job.title, job.company), job)
+
+                # Fallback index by title and company for rows whose URL doesn't match
+                # (exact pairs, served by the (title, company, location) index)
+                unmatched = {(title, company) for url, title, company, *_ in rows
+                             if (url, title, company) not in by_url and isinstance(title, str) and isinstance(company, str)}
+                by_title_company = {}
+                if unmatched:
+                    for job in db.execute(select(*job_keys).where(tuple_(ScrapedJob.title, ScrapedJob.company).in_(list(unmatched)))):
+                        by_title_company.setdefault((job.title, job.company), job)
+
+                # Jobs already in FilteredJobView for this user today, fetched in one query
+                candidate_ids = {job.id for job in chain(by_url.values(), by_title_company.values())}
+                existing_ids = self._existing_filtered_job_ids(db, user_id, today, candidate_ids)
+
+                rows_to_insert = []
+                for url, title, company, relevance_score, enhanced_score, best_keyword, ai_relevance in rows:
                     try:
-                        # Find the corresponding ScrapedJob by matching URL and title
-                        scraped_job = db.query(ScrapedJob).filter(
-                            ScrapedJob.job_url == row.get('Job_URL'),
-                            ScrapedJob.title == row.get('Title'),
-                            ScrapedJob.company == row.get('Company')
-                        ).first()
-
-                        if not scraped_job:
-                            # Try to find by title and company if URL doesn't match
-                            scraped_job = db.query(ScrapedJob).filter(
-                                ScrapedJob.title == row.get('Title'),
-                                ScrapedJob.company == row.get('Company')
-                            ).first()
+                        # Find the corresponding ScrapedJob by matching URL and title,
+                        # or by title and company if URL doesn't match
+                        scraped_job = by_url.get((url, title, company)) or by_title_company.get((title, company))
 
                         if scraped_job:
                             # Check if this job is already in FilteredJobView for today for this user
-                            existing_entry = db.query(FilteredJobView).filter(
-                                FilteredJobView.user_id == user_id,
-                                FilteredJobView.scraped_job_id == scraped_job.id,
-                                FilteredJobView.filter_date == today
-                            ).first()
-
-                            if not existing_entry:
-                                # Create filter criteria metadata
-                                filter_criteria = {
-                                    "min_relevance_score": 60,
-                                    "ai_relevance_excluded": ["Irrelevant"],
-                                    "excluded_titles": ["president", "director", "VP", "chief"],
-                                    "enhanced_scoring": True
-                                }
-
-                                # Create FilteredJobView entry
-                                filtered_view = FilteredJobView(
-                                    user_id=user_id,
-                                    scraped_job_id=scraped_job.id,
-                                    scraping_run_id=scraped_job.scraping_run_id,
-                                    filter_date=today,
-                                    relevance_score=float(row.get('Relevance_Score', 0)),
-                                    enhanced_score=float(row.get('Enhanced_Score', 0)),
-                                    best_matching_keyword=row.get('Best_Matching_Keyword'),
-                                    ai_relevance=row.get('AI_Relevance'),
-                                    filter_criteria=filter_criteria
-                                )
-
-                                db.add(filtered_view)
-                                saved_count += 1
+                            # (or queued earlier in this batch - the unique index would reject the repeat)
+                            if scraped_job.id not in existing_ids:
+                                # Queue the FilteredJobView row for the bulk insert below
+                                rows_to_insert.append({
+                                    "user_id": user_id,
+                                    "scraped_job_id": scraped_job.id,
+                                    "scraping_run_id": scraped_job.scraping_run_id,
+                                    "filter_date": today,
+                                    "relevance_score": float(relevance_score),
+                                    "enhanced_score": float(enhanced_score),
+                                    "best_matching_keyword": best_keyword,
+                                    "ai_relevance": ai_relevance,
+                                    "filter_criteria": _CSV_FILTER_CRITERIA
+                                })
+                                existing_ids.add(scraped_job.id)
                             else:
                                 skipped_count += 1
                         else:
                             not_found_count += 1
 
                     except Exception as row_error:
-                        logger.warning(f"⚠️  Error saving filtered job row: {row_error}")
+                        logger.warning("⚠️  Error saving filtered job row: %s", row_error)
                         continue
 
+                saved_count = self._insert_filtered_job_views(db, rows_to_insert)
+                skipped_count += len(rows_to_insert) - saved_count  # saved concurrently since the lookup
                 db.commit()
                 logger.info(f"✅ Database save results: {saved_count} new, {skipped_count} already exist, {not_found_count} not found in scraped jobs")
 
@@ -728,16 +1016,61 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
         except Exception as e:
             logger.error(f"❌ Error saving filtered jobs to database: {e}")
 
+    def _existing_filtered_job_ids(self, db: Session, user_id: str, filter_date, scraped_job_ids) -> set:
+        """Return which of scraped_job_ids already have a FilteredJobView for this user and date."""
+        from database import FilteredJobView
+
+        if not scraped_job_ids:
+            return set()
+        return set(db.scalars(
+            select(FilteredJobView.scraped_job_id).where(
+                FilteredJobView.user_id == user_id,
+                FilteredJobView.filter_date == filter_date,
+                FilteredJobView.scraped_job_id.in_(scraped_job_ids)
+            )
+        ))
+
+    def _insert_filtered_job_views(self, db: Session, rows: List[dict]) -> int:
+        """
+        Insert FilteredJobView rows with multi-row INSERTs, FILTERED_VIEW_INSERT_BATCH rows per statement.
+
+        On PostgreSQL and SQLite rows that already exist for the same user, job and date are
+        skipped by the database (ON CONFLICT DO NOTHING on the unique index), so a concurrent
+        save can't fail the whole batch. Returns how many rows were inserted. Caller commits.
+        """
+        from database import FilteredJobView
+
+        if not rows:
+            return 0
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            for start in range(0, len(rows), FILTERED_VIEW_INSERT_BATCH):
+                db.execute(insert(FilteredJobView), rows[start:start + FILTERED_VIEW_INSERT_BATCH])
+            return len(rows)
+
+        stmt = dialect_insert(FilteredJobView).on_conflict_do_nothing(
+            index_elements=["user_id", "scraped_job_id", "filter_date"]
+        ).returning(FilteredJobView.id)
+        inserted = 0
+        for start in range(0, len(rows), FILTERED_VIEW_INSERT_BATCH):
+            inserted += len(db.execute(stmt, rows[start:start + FILTERED_VIEW_INSERT_BATCH]).all())
+        return inserted
+
     def create_user_filtered_jobs(self, user_id: str, company_names: list, search_terms: list):
         """Create filtered jobs for a user from all available scraped jobs for the target companies."""
         try:
-            from database import FilteredJobView, ScrapedJob
+            from database import ScrapedJob
             from datetime import date, datetime, timezone, timedelta
-            import pandas as pd
 
             logger.info(f"🔄 Creating filtered jobs for user {user_id}")
 
-            db = SessionLocal()
+            # Nothing loaded here is read back after the commit, so don't expire it
+            db = SessionLocal(expire_on_commit=False)
             try:
                 # Get jobs from the companies we're interested in (within last 30 days to include more data)
                 recent_date = datetime.now(timezone.utc) - timedelta(days=30)
@@ -759,117 +1092,97 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
 
                 logger.info(f"🔍 Found {len(existing_jobs)} jobs to filter for user")
 
-                # Convert jobs to DataFrame for filtering
-                jobs_data = []
-                for job in existing_jobs:
-                    jobs_data.append({
-                        'id': job.id,
-                        'Company': job.company,
-                        'Title': job.title,
-                        'Location': job.location,
-                        'Description': job.description or '',
-                        'Salary_Min': job.min_amount,
-                        'Salary_Max': job.max_amount,
-                        'scraping_run_id': job.scraping_run_id
-                    })
-
-                if not jobs_data:
-                    return 0
-
-                df = pd.DataFrame(jobs_data)
-
                 # Apply scoring and filtering
                 scoring_keywords = [term for term in search_terms if term.lower() not in ['all']]
 
-                # Apply relevance scoring - calculate best score across all search terms
-                def calculate_best_score(row):
-                    best_score = 0
-                    best_keyword = ""
-                    for search_term in scoring_keywords:
-                        score = self.calculate_relevance_score(row.to_dict(), search_term, 0)
-                        if score > best_score:
-                            best_score = score
-                            best_keyword = search_term
-                    return best_score, best_keyword
-                
-                # Calculate scores and best keywords
-                score_results = df.apply(calculate_best_score, axis=1)
-                df['Relevance_Score'] = [result[0] for result in score_results]
-                df['Best_Matching_Keyword'] = [result[1] for result in score_results]
-
-                # Apply AI scoring if available
-                if self.openai_client:
-                    logger.info("🤖 Applying AI relevance evaluation...")
-                    def safe_ai_evaluation(row):
-                        try:
-                            title = str(row['Title']) if row['Title'] is not None else ""
-                            description = str(row['Description']) if row['Description'] is not None else ""
-                            logger.debug(f"Evaluating: {title[:50]}...")
-                            result = self.evaluate_job_relevance_with_ai(title, description)
-                            logger.debug(f"AI result: {result}")
-                            return result
-                        except Exception as e:
-                            logger.error(f"Error in AI evaluation for job '{row.get('Title', 'Unknown')}': {e}")
-                            return "Error"
-
-                    df['AI_Relevance'] = df.apply(safe_ai_evaluation, axis=1)
+                # Apply relevance scoring - best score across all search terms, scored straight from the
+                # loaded rows (same fields as create_jobs_csv); no DataFrame needed for what follows
+                now_epoch = time.time()  # One clock read for the whole batch's recency scoring
+                score_results = [
+                    self.calculate_multi_keyword_score(
+                        {
+                            'title': job.title,
+                            'description': job.description,
+                            'company': job.company,
+                            'job_type': job.job_type,
+                            'min_amount': job.min_amount,
+                            'max_amount': job.max_amount,
+                            'date_posted': job.date_posted
+                        },
+                        scoring_keywords,
+                        None,
+                        now_epoch
+                    )
+                    for job in existing_jobs
+                ]
+
+                # Drop jobs under the score cutoff before the (expensive) AI pass
+                before_filter = len(existing_jobs)
+                candidates = [
+                    (job, result) for job, result in zip(existing_jobs, score_results)
+                    if result['score'] >= MIN_RELEVANCE_FOR_AI
+                ]
+                high_score_count = len(candidates)
+
+                # Apply AI scoring if available - survivors only
+                if self.openai_client and high_score_count:
+                    logger.info(f"🤖 Applying AI relevance evaluation to {high_score_count} of {before_filter} jobs...")
+                    ai_results = self.evaluate_jobs_relevance([
+                        (job.title or "", job.description or "") for job, _ in candidates
+                    ])
                     logger.info("🤖 AI evaluation completed")
                 else:
-                    df['AI_Relevance'] = 'Not Evaluated'
+                    ai_results = ['Not Evaluated'] * high_score_count
 
-                # Filter jobs (score >= 60, not irrelevant)
-                before_filter = len(df)
-                df_filtered = df[
-                    (df['Relevance_Score'] >= 60) &
-                    (df['AI_Relevance'] != 'Irrelevant')
-                ].copy()
+                # Filter jobs (score cutoff above, not irrelevant here)
+                filtered = [
+                    (job, result, ai_relevance)
+                    for (job, result), ai_relevance in zip(candidates, ai_results)
+                    if ai_relevance != 'Irrelevant'
+                ]
 
-                after_filter = len(df_filtered)
+                after_filter = len(filtered)
                 logger.info(f"🎯 After filtering: {after_filter} jobs qualify (from {before_filter} total)")
 
-                if len(df_filtered) == 0:
+                if not filtered:
                     # Log why no jobs qualified
-                    high_score_count = len(df[df['Relevance_Score'] >= 60])
-                    ai_relevant_count = len(df[df['AI_Relevance'] != 'Irrelevant'])
                     logger.info(f"📭 No jobs passed filtering criteria:")
                     logger.info(f"   - Jobs with score ≥60: {high_score_count}")
-                    logger.info(f"   - Jobs not marked 'Irrelevant' by AI: {ai_relevant_count}")
+                    logger.info(f"   - Candidates marked 'Irrelevant' by AI: {high_score_count - after_filter}")
                     logger.info(f"   - User search terms: {search_terms}")
                     return 0
 
                 # Save to FilteredJobView
                 today = date.today()
-                saved_count = 0
 
-                for _, row in df_filtered.iterrows():
-                    # Check if this job is already in FilteredJobView for this user today
-                    existing_entry = db.query(FilteredJobView).filter(
-                        FilteredJobView.user_id == user_id,
-                        FilteredJobView.scraped_job_id == row['id'],
-                        FilteredJobView.filter_date == today
-                    ).first()
-
-                    if not existing_entry:
-                        # Create new FilteredJobView entry
-                        filtered_view = FilteredJobView(
-                            user_id=user_id,
-                            scraped_job_id=row['id'],
-                            scraping_run_id=row['scraping_run_id'],
-                            filter_date=today,
-                            relevance_score=row['Relevance_Score'],
-                            enhanced_score=row['Relevance_Score'],  # Can be enhanced later
-                            best_matching_keyword=row['Best_Matching_Keyword'],
-                            ai_relevance=row['AI_Relevance'],
-                            filter_criteria={
-                                'min_score': 60,
-                                'search_terms': search_terms,
-                                'companies': company_names
-                            }
-                        )
+                # Jobs already in FilteredJobView for this user today, fetched in one query
+                existing_ids = self._existing_filtered_job_ids(db, user_id, today, [job.id for job, _, _ in filtered])
+
+                # Same criteria for every row - build it once
+                filter_criteria = {
+                    'min_score': 60,
+                    'search_terms': search_terms,
+                    'companies': company_names
+                }
 
-                        db.add(filtered_view)
-                        saved_count += 1
+                # FilteredJobView rows for the bulk insert below
+                rows_to_insert = [
+                    {
+                        "user_id": user_id,
+                        "scraped_job_id": job.id,
+                        "scraping_run_id": job.scraping_run_id,
+                        "filter_date": today,
+                        "relevance_score": float(result['score']),
+                        "enhanced_score": float(result['score']),  # Can be enhanced later
+                        "best_matching_keyword": result['best_keyword'],
+                        "ai_relevance": ai_relevance,
+                        "filter_criteria": filter_criteria
+                    }
+                    for job, result, ai_relevance in filtered
+                    if job.id not in existing_ids
+                ]
 
+                saved_count = self._insert_filtered_job_views(db, rows_to_insert)
                 db.commit()
                 logger.info(f"✅ Created {saved_count} filtered job entries for user")
                 return saved_count
@@ -888,15 +1201,6 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
             try:
                 from database import ScrapedJob
                 
-                # Get jobs from the specific scraping run
-                jobs = db.query(ScrapedJob).filter(
-                    ScrapedJob.scraping_run_id == scraping_run_id
-                ).all()
-                
-                if not jobs:
-                    logger.warning("No jobs found for CSV export")
-                    return None
-                
                 # Get search terms from the scraping run parameters
                 scoring_keywords = []
                 expected_salary = 0
@@ -925,7 +1229,11 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
                     scoring_keywords = scoring_config.get('scoring_keywords', [])
                     expected_salary = scoring_config.get('expected_salary', 0)
 
-                if scoring_keywords:
+                # Drop blank keywords once so the per-job loop can skip scoring entirely
+                scoring_keywords = [kw.strip() for kw in scoring_keywords if kw and kw.strip()]
+                compute_score = bool(scoring_keywords)
+
+                if compute_score:
                     logger.info(f"📊 Applying relevance scoring with keywords: {scoring_keywords}, expected salary: ${expected_salary:,}")
                 else:
                     logger.info("📊 No scoring keywords configured - all jobs will have score 0")
@@ -934,56 +1242,74 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
                 site_counts = {}
                 description_counts = {"with_description": 0, "without_description": 0}
                 
-                # Create CSV content
-                output = io.StringIO()
-                writer = csv.writer(output)
-                
-                # Write header with Relevance_Score, Best_Keyword, and AI_Relevance columns
-                writer.writerow([
+                # CSV header with Relevance_Score, Best_Keyword, and AI_Relevance columns
+                header = [
                     'Company', 'Title', 'Location', 'Description', 'Salary_Min', 'Salary_Max',
                     'Salary_Interval', 'Currency', 'Date_Posted', 'Date_Scraped', 'Job_URL',
                     'Site', 'Job_Type', 'Is_Remote', 'Min_Experience_Years', 'Max_Experience_Years',
                     'Relevance_Score', 'Best_Matching_Keyword', 'AI_Relevance'
-                ])
-                
+                ]
+
                 # Write job data with relevance scores
                 jobs_with_scores = 0
                 ai_evaluations_done = 0
                 ai_evaluations_skipped = 0
-                for job_index, job in enumerate(jobs):
-                    # Convert job to dict for scoring function
-                    job_dict = {
-                        'title': job.title,
-                        'description': job.description,
-                        'company': job.company,
-                        'job_type': job.job_type,
-                        'min_amount': job.min_amount,
-                        'max_amount': job.max_amount,
-                        'date_posted': job.date_posted
-                    }
-                    
+                rows = []
+                ai_pending = []  # (row index, title, description) to evaluate in one concurrent batch
+                now_epoch = time.time()  # One clock read for the whole run's recency scoring
+
+                # Get jobs from the specific scraping run - only the columns the CSV needs, as plain
+                # rows streamed in chunks rather than a fully loaded list of ScrapedJob objects
+                jobs = db.execute(
+                    select(
+                        ScrapedJob.company, ScrapedJob.title, ScrapedJob.location,
+                        ScrapedJob.description, ScrapedJob.min_amount, ScrapedJob.max_amount,
+                        ScrapedJob.salary_interval, ScrapedJob.currency, ScrapedJob.date_posted,
+                        ScrapedJob.date_scraped, ScrapedJob.job_url, ScrapedJob.site,
+                        ScrapedJob.job_type, ScrapedJob.is_remote,
+                        ScrapedJob.min_experience_years, ScrapedJob.max_experience_years
+                    ).where(ScrapedJob.scraping_run_id == scraping_run_id).execution_options(yield_per=1000)
+                )
+                # Unpack each row once into locals (same order as the select) rather than
+                # looking every field up by attribute name on the Row
+                for job_index, (
+                    company, title, location, description, min_amount, max_amount,
+                    salary_interval, currency, date_posted, date_scraped, job_url, site,
+                    job_type, is_remote, min_experience_years, max_experience_years
+                ) in enumerate(jobs):
                     # Calculate relevance score for multiple keywords
                     relevance_score = 0
                     best_keyword = ''
-                    if scoring_keywords:
+                    if compute_score:
+                        # Convert job to dict for scoring function
+                        job_dict = {
+                            'title': title,
+                            'description': description,
+                            'company': company,
+                            'job_type': job_type,
+                            'min_amount': min_amount,
+                            'max_amount': max_amount,
+                            'date_posted': date_posted
+                        }
                         scoring_result = self.calculate_multi_keyword_score(
                             job_dict, 
                             scoring_keywords, 
-                            expected_salary if expected_salary > 0 else None
+                            expected_salary if expected_salary > 0 else None,
+                            now_epoch
                         )
                         relevance_score = scoring_result['score']
                         best_keyword = scoring_result['best_keyword']
                         
                         # Log first few scores for debugging
                         if job_index < 3:
-                            logger.info(f"🔍 Job {job_index+1}: '{job.title}' scored {relevance_score} (best: '{best_keyword}')")
+                            logger.info("🔍 Job %d: '%s' scored %s (best: '%s')", job_index + 1, title, relevance_score, best_keyword)
                         if relevance_score > 0:
                             jobs_with_scores += 1
 
                     # Track statistics
-                    site = job.site or 'unknown'
-                    site_counts[site] = site_counts.get(site, 0) + 1
-                    has_description = bool(job.description and job.description.strip())
+                    site_key = site or 'unknown'
+                    site_counts[site_key] = site_counts.get(site_key, 0) + 1
+                    has_description = bool(description and description.strip())
                     if has_description:
                         description_counts["with_description"] += 1
                     else:
@@ -992,23 +1318,11 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
                     # Get AI relevance evaluation (only for jobs with good relevance scores)
                     ai_relevance = "Not Evaluated"
 
-                    # Only do AI evaluation if job meets minimum relevance threshold
-                    min_relevance_for_ai = 60  # Same threshold used for filtering
-
-                    if relevance_score >= min_relevance_for_ai and self.openai_client:
-                        try:
-                            ai_relevance = self.evaluate_job_relevance_with_ai(
-                                job.title or '',
-                                job.description or ''
-                            )
-                            ai_evaluations_done += 1
-                            # Log AI evaluation for first few jobs
-                            if job_index < 3:
-                                logger.info(f"🤖 AI evaluation for '{job.title}': {ai_relevance}")
-                        except Exception as e:
-                            logger.warning(f"AI evaluation failed for job {job_index+1}: {e}")
-                            ai_relevance = "AI Error"
-                    elif relevance_score < min_relevance_for_ai:
+                    # Only do AI evaluation if job meets minimum relevance threshold (same threshold used for filtering)
+                    if relevance_score >= MIN_RELEVANCE_FOR_AI and self.openai_client:
+                        # Filled in after the loop, once the whole batch has been evaluated
+                        ai_pending.append((job_index, title or '', description or ''))
+                    elif relevance_score < MIN_RELEVANCE_FOR_AI:
                         ai_relevance = "Low Relevance - Skipped"
                         ai_evaluations_skipped += 1
                     elif not self.openai_client:
@@ -1016,34 +1330,51 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
                             logger.warning("🤖 AI evaluation skipped - OpenAI client not configured")
                         ai_relevance = "AI Not Configured"
 
-                    writer.writerow([
-                        job.company or '',
-                        job.title or '',
-                        job.location or '',
-                        (job.description or '').replace('\n', ' ').replace('\r', '') if job.description else '',
-                        job.min_amount or '',
-                        job.max_amount or '',
-                        job.salary_interval or '',
-                        job.currency or '',
-                        job.date_posted.strftime('%Y-%m-%d') if job.date_posted else '',
-                        job.date_scraped.strftime('%Y-%m-%d %H:%M:%S') if job.date_scraped else '',
-                        job.job_url or '',
-                        job.site or '',
-                        job.job_type or '',
-                        'Yes' if job.is_remote else 'No',
-                        job.min_experience_years or '',
-                        job.max_experience_years or '',
+                    rows.append([
+                        company or '',
+                        title or '',
+                        location or '',
+                        description.translate(_NEWLINE_TRANS) if description else '',
+                        min_amount or '',
+                        max_amount or '',
+                        salary_interval or '',
+                        currency or '',
+                        # isoformat slices match the old strftime output (no tz suffix) but skip format parsing
+                        date_posted.isoformat()[:10] if date_posted else '',
+                        date_scraped.isoformat(sep=' ', timespec='seconds')[:19] if date_scraped else '',
+                        job_url or '',
+                        site or '',
+                        job_type or '',
+                        'Yes' if is_remote else 'No',
+                        min_experience_years or '',
+                        max_experience_years or '',
                         relevance_score,
                         best_keyword,
                         ai_relevance
                     ])
-                
-                # Save to temporary file
+
+                if not rows:
+                    logger.warning("No jobs found for CSV export")
+                    return None
+
+                if ai_pending:
+                    logger.info(f"🤖 Evaluating {len(ai_pending)} jobs with AI...")
+                    ai_results = self.evaluate_jobs_relevance([(title, description) for _, title, description in ai_pending])
+                    for (job_index, title, _), ai_relevance in zip(ai_pending, ai_results):
+                        rows[job_index][-1] = ai_relevance
+                        # Log AI evaluation for first few jobs
+                        if job_index < 3:
+                            logger.info("🤖 AI evaluation for '%s': %s", title, ai_relevance)
+                    ai_evaluations_done = len(ai_pending)
+
+                # Save to temporary file, writing the rows straight to disk
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 csv_filename = f"jobspy_daily_scraping_{timestamp}.csv"
-                
+
                 with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                    f.write(output.getvalue())
+                    writer = csv.writer(f)
+                    writer.writerow(header)
+                    writer.writerows(rows)
                 
                 # Log scoring summary if keywords were used
                 ai_status = "with AI relevance evaluation" if self.openai_client else "without AI evaluation (OpenAI not configured)"
@@ -1053,19 +1384,22 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
                 logger.info(f"📝 Description availability: {description_counts['with_description']} with descriptions, {description_counts['without_description']} without")
 
                 if scoring_keywords:
-                    logger.info(f"📄 Created CSV export: {csv_filename} with {len(jobs)} jobs, multi-keyword relevance scores, {ai_status}")
+                    logger.info(f"📄 Created CSV export: {csv_filename} with {len(rows)} jobs, multi-keyword relevance scores, {ai_status}")
                     logger.info(f"📊 Scoring keywords used: {', '.join(scoring_keywords)}")
-                    logger.info(f"📊 Jobs with scores > 0: {jobs_with_scores} out of {len(jobs)}")
+                    logger.info(f"📊 Jobs with scores > 0: {jobs_with_scores} out of {len(rows)}")
                     if self.openai_client:
                         logger.info(f"🤖 AI evaluations: {ai_evaluations_done} done, {ai_evaluations_skipped} skipped (optimization)")
                 else:
-                    logger.info(f"📄 Created CSV export: {csv_filename} with {len(jobs)} jobs (no keyword scoring applied), {ai_status}")
+                    logger.info(f"📄 Created CSV export: {csv_filename} with {len(rows)} jobs (no keyword scoring applied), {ai_status}")
 
                 # Create filtered version if AI evaluation is available
                 filtered_csv_filename = None
                 if self.openai_client:
                     logger.info("🎯 Creating filtered and enhanced CSV...")
-                    filtered_csv_filename = self.create_filtered_jobs_csv(csv_filename, user_id)
+                    # Hand over the rows we already have instead of parsing the CSV we just wrote
+                    import pandas as pd
+                    jobs_df = pd.DataFrame(rows, columns=header)
+                    filtered_csv_filename = self.create_filtered_jobs_csv(csv_filename, user_id, jobs_df=jobs_df)
 
                 # Return both filenames as a tuple
                 return csv_filename, filtered_csv_filename
@@ -1085,7 +1419,7 @@ Rate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant,
         
         try:
             # Create message
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = self.email_user
             msg['To'] = self.notification_email
             msg['Subject'] = f"🤖 JobSpy Daily Scraping Report - {summary.get('date', 'Unknown')}"
@@ -1120,47 +1454,27 @@ Completed: {summary.get('end_time', 'Unknown')}
 Generated by JobSpy Automated Scraping System
             """.strip()
             
-            msg.attach(MIMEText(body, 'plain'))
+            msg.set_content(body, cte='quoted-printable')  # 7-bit safe for the emoji, like the old MIMEText part
             
             # Attach original CSV file if provided
             if csv_filename and os.path.exists(csv_filename):
-                with open(csv_filename, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-
-                encoders.encode_base64(part)
                 # Create a more user-friendly filename for the attachment
                 attachment_filename = f"JobSpy_Daily_Jobs_{summary.get('date', datetime.now().strftime('%Y-%m-%d'))}.csv"
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename="{attachment_filename}"'
-                )
-                msg.attach(part)
+                self._attach_file(msg, csv_filename, attachment_filename)
                 logger.info(f"📎 Attached complete CSV: {attachment_filename} ({summary.get('total_jobs', 0)} jobs included)")
 
             # Attach filtered CSV file if provided
             if filtered_csv_filename and os.path.exists(filtered_csv_filename):
-                with open(filtered_csv_filename, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-
-                encoders.encode_base64(part)
                 # Create a more user-friendly filename for the filtered attachment
                 filtered_attachment_filename = f"JobSpy_Filtered_Jobs_{summary.get('date', datetime.now().strftime('%Y-%m-%d'))}.csv"
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename="{filtered_attachment_filename}"'
-                )
-                msg.attach(part)
+                self._attach_file(msg, filtered_csv_filename, filtered_attachment_filename)
                 logger.info(f"📎 Attached filtered CSV: {filtered_attachment_filename} (high-quality jobs only)")
             
-            # Send email
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-            text = msg.as_string()
-            server.sendmail(self.email_user, self.notification_email, text)
-            server.quit()
+            # Send email - send_message serializes straight to bytes (no intermediate str copy)
+            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.email_user, self.email_password)
+                server.send_message(msg, self.email_user, [self.notification_email])
             
             logger.info(f"📧 Notification email sent to {self.notification_email}")
             
@@ -1176,67 +1490,101 @@ Generated by JobSpy Automated Scraping System
         except Exception as e:
             logger.error(f"Failed to send notification email: {e}")
     
-    async def _send_completion_notification(self, scraping_run, company_names, search_terms, start_time, end_time, duration, user_id: str = None):
-        """Send notification email when scraping completes successfully."""
+    def _attach_file(self, msg: EmailMessage, path: str, attachment_filename: str):
+        """Attach a file to the email as a base64-encoded octet-stream part."""
+        with open(path, "rb") as attachment:
+            msg.add_attachment(
+                attachment.read(),
+                maintype='application',
+                subtype='octet-stream',
+                filename=attachment_filename
+            )
+
+    def _completion_summary(self, scraping_run_id, company_names, search_terms, start_time, end_time, duration) -> dict:
+        """Build the notification summary (job counts for the run) - blocking DB work, run off the loop."""
+        from database import ScrapedJob
+
+        with SessionLocal() as db:
+            # Job counts per scraped company name in one GROUP BY; the total and the
+            # per-target counts (case-insensitive substring match) come from that
+            company_counts = [
+                ((company or '').lower(), count)
+                for company, count in db.execute(
+                    select(ScrapedJob.company, func.count())
+                    .where(ScrapedJob.scraping_run_id == scraping_run_id)
+                    .group_by(ScrapedJob.company)
+                )
+            ]
+        total_jobs = sum(count for _, count in company_counts)
+        
+        # Get job counts by company
+        company_details = ""
+        for company_name in company_names:
+            name_lower = company_name.lower()
+            company_job_count = sum(count for company, count in company_counts if name_lower in company)
+            company_details += f"• {company_name}: {company_job_count} jobs\n"
+        
+        return {
+            'date': start_time.strftime('%Y-%m-%d'),
+            'companies_scraped': len(company_names),
+            'total_jobs': total_jobs,
+            'new_jobs': total_jobs,  # Assuming all jobs are new for now
+            'duration': f"{duration.total_seconds():.1f} seconds",
+            'success_rate': '100%',
+            'company_details': company_details.strip(),
+            'search_terms': search_terms,
+            'start_time': start_time.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'end_time': end_time.strftime('%Y-%m-%d %H:%M:%S UTC')
+        }
+
+    async def _send_completion_notification(self, scraping_run_id, company_names, search_terms, start_time, end_time, duration, user_id: str = None):
+        """
+        Send notification email when scraping completes successfully.
+
+        Every step here blocks (DB queries, CSV export, the AI pass, SMTP), so each one runs
+        in a worker thread - the scheduler loop keeps serving other runs and triggers meanwhile.
+        """
         try:
-            # Get job statistics from the scraping run
-            db = SessionLocal()
-            try:
-                from database import ScrapedJob
-                
-                total_jobs = db.query(ScrapedJob).filter(
-                    ScrapedJob.scraping_run_id == scraping_run.id
-                ).count()
-                
-                # Get job counts by company
-                company_details = ""
-                for company_name in company_names:
-                    company_job_count = db.query(ScrapedJob).filter(
-                        ScrapedJob.scraping_run_id == scraping_run.id,
-                        ScrapedJob.company.ilike(f"%{company_name}%")
-                    ).count()
-                    company_details += f"• {company_name}: {company_job_count} jobs\n"
-                
-                # Create summary
-                summary = {
-                    'date': start_time.strftime('%Y-%m-%d'),
-                    'companies_scraped': len(company_names),
-                    'total_jobs': total_jobs,
-                    'new_jobs': total_jobs,  # Assuming all jobs are new for now
-                    'duration': f"{duration.total_seconds():.1f} seconds",
-                    'success_rate': '100%',
-                    'company_details': company_details.strip(),
-                    'search_terms': search_terms,
-                    'start_time': start_time.strftime('%Y-%m-%d %H:%M:%S UTC'),
-                    'end_time': end_time.strftime('%Y-%m-%d %H:%M:%S UTC')
-                }
-                
-                # Create CSV export (both original and filtered versions)
-                csv_result = self.create_jobs_csv(scraping_run.id, user_id)
-                if isinstance(csv_result, tuple):
-                    csv_filename, filtered_csv_filename = csv_result
-                else:
-                    # Backward compatibility if only one filename is returned
-                    csv_filename = csv_result
-                    filtered_csv_filename = None
+            summary = await asyncio.to_thread(
+                self._completion_summary, scraping_run_id, company_names, search_terms, start_time, end_time, duration
+            )
+            total_jobs = summary['total_jobs']
+            
+            # Create CSV export (both original and filtered versions)
+            csv_result = await asyncio.to_thread(self.create_jobs_csv, scraping_run_id, user_id)
+            if isinstance(csv_result, tuple):
+                csv_filename, filtered_csv_filename = csv_result
+            else:
+                # Backward compatibility if only one filename is returned
+                csv_filename = csv_result
+                filtered_csv_filename = None
 
-                # Always create filtered jobs for the user from available data (existing + new)
-                if user_id:
-                    self.create_user_filtered_jobs(user_id, company_names, search_terms)
+            # Always create filtered jobs for the user from available data (existing + new)
+            if user_id:
+                await asyncio.to_thread(self.create_user_filtered_jobs, user_id, company_names, search_terms)
 
-                # Create daily job review list
-                await self._create_daily_review_list(start_time, total_jobs)
+            # Create daily job review list
+            await self._create_daily_review_list(start_time, total_jobs)
 
-                # Send notification with both CSV files
-                self.send_notification_email(summary, csv_filename, filtered_csv_filename)
-                
-                logger.info(f"📧 Notification sent with {total_jobs} jobs from {len(company_names)} companies")
-                
-            finally:
-                db.close()
+            # Send notification with both CSV files
+            await asyncio.to_thread(self.send_notification_email, summary, csv_filename, filtered_csv_filename)
+            
+            logger.info(f"📧 Notification sent with {total_jobs} jobs from {len(company_names)} companies")
                 
         except Exception as e:
             logger.error(f"Failed to send completion notification: {e}")
+
+    def _notify_completion(self, *args):
+        """Send the completion notification in the background so the run can wrap up without waiting on SMTP."""
+        task = asyncio.get_running_loop().create_task(self._send_completion_notification(*args))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+        return task
+
+    async def wait_for_notifications(self):
+        """Wait for any completion notifications that are still being sent."""
+        if self._notify_tasks:
+            await asyncio.gather(*self._notify_tasks, return_exceptions=True)
     
     async def _create_daily_review_list(self, scraping_date, total_jobs_scraped):
         """Create a daily job review list after scraping completes."""
@@ -1245,21 +1593,21 @@ Generated by JobSpy Automated Scraping System
             if total_jobs_scraped > 0:
                 target_date = scraping_date.strftime("%Y-%m-%d")
                 
-                db = SessionLocal()
-                try:
-                    review_list = daily_job_reviewer.create_daily_review_list(
-                        target_date=target_date,
-                        db=db,
-                        force_recreate=True  # Recreate after new scraping
-                    )
-                    
-                    if review_list:
-                        logger.info(f"📋 Created daily review list for {target_date} with {review_list.jobs_selected_count} jobs")
-                    else:
-                        logger.warning(f"📋 No jobs qualified for daily review list on {target_date}")
-                        
-                finally:
-                    db.close()
+                def create_review_list():
+                    with SessionLocal() as db:
+                        review_list = daily_job_reviewer.create_daily_review_list(
+                            target_date=target_date,
+                            db=db,
+                            force_recreate=True  # Recreate after new scraping
+                        )
+                        return review_list.jobs_selected_count if review_list else None
+
+                # Blocking DB work, keep it off the scheduler loop
+                selected_count = await asyncio.to_thread(create_review_list)
+                if selected_count is not None:
+                    logger.info(f"📋 Created daily review list for {target_date} with {selected_count} jobs")
+                else:
+                    logger.warning(f"📋 No jobs qualified for daily review list on {target_date}")
             else:
                 logger.info("📋 Skipping daily review list creation - no jobs scraped")
                 
@@ -1282,33 +1630,68 @@ Generated by JobSpy Automated Scraping System
                 'end_time': 'N/A - Failed'
             }
             
-            self.send_notification_email(summary)
+            await asyncio.to_thread(self.send_notification_email, summary)
             logger.info("📧 Failure notification sent")
             
         except Exception as e:
             logger.error(f"Failed to send failure notification: {e}")
     
-    def should_scrape_company(self, company: TargetCompany) -> bool:
-        """Check if a company should be scraped based on last scrape time."""
+    @staticmethod
+    def _scraped_since(company: TargetCompany, cutoff: datetime) -> bool:
+        """True if the company was scraped at or after cutoff (naive timestamps are UTC)."""
+        last_scraped = company.last_scraped
+        if not last_scraped:
+            return False
+        if last_scraped.tzinfo is None:
+            last_scraped = last_scraped.replace(tzinfo=timezone.utc)
+        return last_scraped >= cutoff
+
+    def should_scrape_company(self, company: TargetCompany, now: Optional[datetime] = None) -> bool:
+        """
+        Check if a company should be scraped based on last scrape time.
+
+        For single companies only - batch runs pass scraped_before to
+        get_active_companies so the check happens in the query. Pass now
+        (UTC-aware) when checking several companies to read the clock once.
+        """
         if not company.last_scraped:
-            logger.info(f"Company '{company.name}' has never been scraped - will scrape")
+            logger.info("Company '%s' has never been scraped - will scrape", company.name)
             return True
         
         # Check if it's been more than 23 hours since last scrape (allow some buffer)
-        # Handle timezone-naive datetime from database
+        # Handle timezone-naive datetime from database (aware values are used as-is)
         last_scraped = company.last_scraped
         if last_scraped.tzinfo is None:
             last_scraped = last_scraped.replace(tzinfo=timezone.utc)
         
-        time_since_last_scrape = datetime.now(timezone.utc) - last_scraped
-        should_scrape = time_since_last_scrape > timedelta(hours=23)
+        time_since_last_scrape = (now or datetime.now(timezone.utc)) - last_scraped
+        should_scrape = time_since_last_scrape > RESCRAPE_INTERVAL
         
         if should_scrape:
-            logger.info(f"Company '{company.name}' last scraped {time_since_last_scrape.total_seconds()/3600:.1f} hours ago - will scrape")
+            logger.info("Company '%s' last scraped %.1f hours ago - will scrape", company.name, time_since_last_scrape.total_seconds() / 3600)
         else:
-            logger.info(f"Company '{company.name}' was scraped recently - skipping")
+            logger.info("Company '%s' was scraped recently - skipping", company.name)
         
         return should_scrape
+
+    def _merge_company_search_terms(self, companies: List[TargetCompany]) -> List[str]:
+        """Union of each company's search terms (built-in defaults when it has none), first-seen order."""
+        return list(dict.fromkeys(chain.from_iterable(
+            company.search_terms or self.default_search_terms for company in companies
+        )))
+
+    def _mark_companies_scraped(self, db: Session, company_ids: List[str]):
+        """Stamp last_scraped for the given companies with a single bulk UPDATE.
+
+        The timestamp comes from the database clock (func.now() renders as
+        CURRENT_TIMESTAMP on SQLite and now() on PostgreSQL, both UTC here).
+        """
+        if not company_ids:
+            return
+        db.query(TargetCompany).filter(TargetCompany.id.in_(company_ids)).update(
+            {TargetCompany.last_scraped: func.now()},
+            synchronize_session=False
+        )
     
     async def run_targeted_scraping(self, target_company_names, custom_search_terms=None, user_id: str = None, location=None, distance=None, max_results=None):
         """Execute scraping for specific companies."""
@@ -1321,38 +1704,48 @@ Generated by JobSpy Automated Scraping System
         logger.info(f"🏢 Target companies: {', '.join(target_company_names)}")
         
         try:
-            # Get all active companies from database
-            db = SessionLocal()
-            try:
-                all_companies = db.query(TargetCompany).filter(
-                    TargetCompany.is_active == True
-                ).all()
+            # One session for the whole run: company lookup, scraping and the last_scraped update.
+            # scraping_run is still read after the commit - keep it loaded rather than re-fetched
+            with SessionLocal(expire_on_commit=False) as db:
+                # Get the requested active companies from database (case-insensitive match in SQL)
+                target_names_lower = {name.lower() for name in target_company_names}
+                active_companies = db.execute(
+                    select(TargetCompany)
+                    .where(
+                        TargetCompany.is_active == True,
+                        func.lower(TargetCompany.name).in_(target_names_lower)
+                    )
+                    .execution_options(yield_per=500)
+                ).scalars()
                 
-                # Filter to only target companies (case-insensitive match)
-                target_names_lower = [name.lower() for name in target_company_names]
+                # Keep one company per name, stop reading once every name is matched
                 companies_to_scrape = []
                 seen_names_lower = set()
 
-                for company in all_companies:
-                    if company.name.lower() in target_names_lower and company.name.lower() not in seen_names_lower:
-                        companies_to_scrape.append(company)
-                        seen_names_lower.add(company.name.lower())
-                        logger.info(f"✅ Found target company: {company.name}")
+                try:
+                    for company in active_companies:
+                        name_lower = company.name.lower()
+                        if name_lower in target_names_lower and name_lower not in seen_names_lower:
+                            companies_to_scrape.append(company)
+                            seen_names_lower.add(name_lower)
+                            logger.info("✅ Found target company: %s", company.name)
+                            if len(seen_names_lower) == len(target_names_lower):
+                                break
+                finally:
+                    active_companies.close()
                 
                 # Check for companies not found in database and auto-create them
-                found_names = [c.name.lower() for c in companies_to_scrape]
                 missing_companies = [name for name in target_company_names 
-                                   if name.lower() not in found_names]
+                                   if name.lower() not in seen_names_lower]
                 
                 if missing_companies:
                     logger.info(f"🔧 {len(missing_companies)} companies not found in database, creating them automatically...")
-                    for company_name in missing_companies:
-                        new_company = self._create_target_company(db, company_name)
-                        if new_company:
-                            companies_to_scrape.append(new_company)
-                            logger.info(f"✅ Created and added target company: {new_company.name}")
-                        else:
-                            logger.warning(f"❌ Failed to create company: {company_name}")
+                    new_companies = self._create_target_companies(db, missing_companies)
+                    if new_companies:
+                        companies_to_scrape.extend(new_companies)
+                        logger.info(f"✅ Created and added {len(new_companies)} target companies")
+                    else:
+                        logger.warning(f"❌ Failed to create companies: {', '.join(missing_companies)}")
                 
                 if not companies_to_scrape:
                     logger.warning("❌ No companies available for scraping (creation may have failed)")
@@ -1360,63 +1753,48 @@ Generated by JobSpy Automated Scraping System
                 
                 # Extract data while session is still active
                 company_names = [company.name for company in companies_to_scrape]
+                company_ids = [company.id for company in companies_to_scrape]
                 
                 # Use custom search terms or company-specific terms
-                search_terms = set()
                 if custom_search_terms:
-                    search_terms.update(custom_search_terms)
+                    search_terms = list(dict.fromkeys(custom_search_terms))
                     logger.info(f"🔍 Using custom search terms: {', '.join(custom_search_terms)}")
                 else:
                     # Use company-specific search terms or defaults
-                    for company in companies_to_scrape:
-                        if company.search_terms:
-                            search_terms.update(company.search_terms)
-                        else:
-                            search_terms.update(self.default_search_terms)
+                    search_terms = self._merge_company_search_terms(companies_to_scrape)
                     logger.info(f"🔍 Using default/company-specific search terms")
 
-                
-                search_terms = list(search_terms)
-                    
-            finally:
-                db.close()
+                logger.info(f"🚀 Will scrape {len(company_names)} companies with {len(search_terms)} search terms")
+                logger.info(f"📝 Search terms: {', '.join(search_terms[:5])}{'...' if len(search_terms) > 5 else ''}")
             
-            logger.info(f"🚀 Will scrape {len(company_names)} companies with {len(search_terms)} search terms")
-            logger.info(f"📝 Search terms: {', '.join(search_terms[:5])}{'...' if len(search_terms) > 5 else ''}")
-            
-            # Get configuration values
-            results_per_company = self._get_default_results_per_company()
-            hours_old = self._get_default_hours_old()
-            days_old = max(1, hours_old // 24)  # Convert hours to days
-
-            # Create bulk scraping request
-            scraping_request = BulkScrapingRequest(
-                company_names=company_names,
-                search_terms=search_terms,
-                results_per_company=results_per_company,
-                sites=["indeed", "linkedin"],
-                locations=["USA"],
-                job_types=[],
-                days_old=days_old,
-                is_remote=None,
-                auto_scraping=True
-            )
+                # Get configuration values
+                results_per_company = self._get_default_results_per_company()
+                hours_old = self._get_default_hours_old()
+                days_old = max(1, hours_old // 24)  # Convert hours to days
+
+                # Create bulk scraping request
+                scraping_request = BulkScrapingRequest(
+                    company_names=company_names,
+                    search_terms=search_terms,
+                    results_per_company=results_per_company,
+                    sites=["indeed", "linkedin"],
+                    locations=["USA"],
+                    job_types=[],
+                    days_old=days_old,
+                    is_remote=None,
+                    auto_scraping=True
+                )
             
-            # Execute scraping with progress logging
-            db = SessionLocal()
-            try:
+                # Execute scraping with progress logging
                 logger.info("⏳ Starting job scraping process...")
                 scraping_run = await self.job_scraper.bulk_scrape_companies(scraping_request, db)
                 
-                # Update last_scraped timestamp
-                for company in companies_to_scrape:
-                    company.last_scraped = datetime.now(timezone.utc)
-                    db.merge(company)
-                
-                db.commit()
-                
                 end_time = datetime.now(timezone.utc)
                 duration = end_time - start_time
+
+                # Update last_scraped timestamp
+                self._mark_companies_scraped(db, company_ids)
+                db.commit()
                 
                 if scraping_run:
                     logger.info(f"✅ Targeted scraping completed successfully!")
@@ -1425,12 +1803,9 @@ Generated by JobSpy Automated Scraping System
                     logger.info(f"🎯 Companies scraped: {len(company_names)}")
                     
                     # Send notification email with results
-                    await self._send_completion_notification(scraping_run, company_names, search_terms, start_time, end_time, duration, user_id)
+                    self._notify_completion(scraping_run.id, company_names, search_terms, start_time, end_time, duration, user_id)
                 else:
                     logger.error("❌ Targeted scraping failed - no scraping run created")
-                    
-            finally:
-                db.close()
                 
         except Exception as e:
             logger.error(f"❌ Targeted scraping failed: {str(e)}", exc_info=True)
@@ -1448,88 +1823,70 @@ Generated by JobSpy Automated Scraping System
         logger.info(f"🚀 Starting automated daily scraping at {start_time}")
         
         try:
-            # Get active companies
-            companies = self.get_active_companies()
-            if not companies:
-                logger.warning("No active target companies found - skipping scraping")
-                return
-            
-            # Filter companies that need scraping
-            companies_to_scrape = [c for c in companies if self.should_scrape_company(c)]
+            # One session for the whole run: company selection, scraping and the last_scraped update.
+            # scraping_run is still read after the commit - keep it loaded rather than re-fetched
+            with SessionLocal(expire_on_commit=False) as db:
+                # Get active companies that need scraping (not scraped within RESCRAPE_INTERVAL)
+                companies_to_scrape = self.get_active_companies(scraped_before=start_time - RESCRAPE_INTERVAL, db=db)
             
-            if not companies_to_scrape:
-                logger.info("No companies need scraping at this time")
-                return
-            
-            # Prepare company names for bulk scraping
-            company_names = [company.name for company in companies_to_scrape]
-            
-            # Determine search terms - use saved defaults, company-specific, or fallback defaults
-            search_terms = set()
+                if not companies_to_scrape:
+                    logger.info("No companies need scraping at this time")
+                    return
             
-            # First try to get search terms from scraping defaults file
-            default_search_terms = self._get_default_search_terms()
-            if default_search_terms:
-                search_terms.update(default_search_terms)
-                logger.info(f"🔍 Using search terms from defaults: {', '.join(default_search_terms)}")
-            else:
-                # Fallback to company-specific or built-in defaults
-                for company in companies_to_scrape:
-                    if company.search_terms:
-                        search_terms.update(company.search_terms)
-                    else:
-                        search_terms.update(self.default_search_terms)
-                logger.info(f"🔍 Using fallback search terms")
+                # Prepare company names for bulk scraping
+                company_names = [company.name for company in companies_to_scrape]
+                company_ids = [company.id for company in companies_to_scrape]
             
-            search_terms = list(search_terms)
+                # Determine search terms - use saved defaults, company-specific, or fallback defaults
+                # First try to get search terms from scraping defaults file
+                default_search_terms = self._get_default_search_terms()
+                if default_search_terms:
+                    search_terms = list(dict.fromkeys(default_search_terms))
+                    logger.info(f"🔍 Using search terms from defaults: {', '.join(default_search_terms)}")
+                else:
+                    # Fallback to company-specific or built-in defaults
+                    search_terms = self._merge_company_search_terms(companies_to_scrape)
+                    logger.info(f"🔍 Using fallback search terms")
             
-            logger.info(f"Will scrape {len(company_names)} companies with {len(search_terms)} search terms")
-            logger.info(f"Companies: {', '.join(company_names)}")
-            logger.info(f"Search terms: {', '.join(search_terms)}")
+                logger.info(f"Will scrape {len(company_names)} companies with {len(search_terms)} search terms")
+                logger.info(f"Companies: {', '.join(company_names)}")
+                logger.info(f"Search terms: {', '.join(search_terms)}")
             
-            # Get configuration values
-            results_per_company = self._get_default_results_per_company()
-            hours_old = self._get_default_hours_old()
-            days_old = max(1, hours_old // 24)  # Convert hours to days
-
-            # Create bulk scraping request
-            scraping_request = BulkScrapingRequest(
-                company_names=company_names,
-                search_terms=search_terms,
-                results_per_company=results_per_company,
-                sites=["indeed", "linkedin"],  # Default sites
-                locations=["USA"],  # Default location
-                job_types=[],  # All job types
-                days_old=days_old,  # Jobs from configuration
-                is_remote=None,  # Both remote and non-remote
-                auto_scraping=True  # Flag to indicate this is auto-scraping
-            )
+                # Get configuration values
+                results_per_company = self._get_default_results_per_company()
+                hours_old = self._get_default_hours_old()
+                days_old = max(1, hours_old // 24)  # Convert hours to days
+
+                # Create bulk scraping request
+                scraping_request = BulkScrapingRequest(
+                    company_names=company_names,
+                    search_terms=search_terms,
+                    results_per_company=results_per_company,
+                    sites=["indeed", "linkedin"],  # Default sites
+                    locations=["USA"],  # Default location
+                    job_types=[],  # All job types
+                    days_old=days_old,  # Jobs from configuration
+                    is_remote=None,  # Both remote and non-remote
+                    auto_scraping=True  # Flag to indicate this is auto-scraping
+                )
             
-            # Execute scraping
-            db = SessionLocal()
-            try:
+                # Execute scraping
                 scraping_run = await self.job_scraper.bulk_scrape_companies(scraping_request, db)
                 
-                # Update last_scraped timestamp for scraped companies
-                for company in companies_to_scrape:
-                    company.last_scraped = datetime.now(timezone.utc)
-                    db.merge(company)
-                
-                db.commit()
-                
                 end_time = datetime.now(timezone.utc)
                 duration = end_time - start_time
+
+                # Update last_scraped timestamp for scraped companies
+                self._mark_companies_scraped(db, company_ids)
+                db.commit()
                 
                 logger.info(f"✅ Automated scraping completed successfully!")
                 logger.info(f"   Duration: {duration.total_seconds():.1f} seconds")
                 logger.info(f"   Scraping run ID: {scraping_run.id}")
                 
                 # Send notification email with results
-                await self._send_completion_notification(scraping_run, company_names, search_terms, start_time, end_time, duration, None)
-                
-            finally:
-                db.close()
-                
+                self._notify_completion(scraping_run.id, company_names, search_terms, start_time, end_time, duration, None)
+
         except Exception as e:
             logger.error(f"❌ Automated scraping failed: {str(e)}")
             import traceback
@@ -1546,74 +1903,97 @@ Generated by JobSpy Automated Scraping System
         # Schedule user-specific autoscraping
         self.schedule_user_autoscraping()
 
-        # Also allow manual trigger via special time check
-        schedule.every(1).minutes.do(self._check_manual_trigger)
+        # Also allow manual trigger via special time check, unless the trigger file is being watched
+        if self._trigger_observer is None:
+            schedule.every(1).minutes.do(self._check_manual_trigger)
+
+        self._schedule_changed_at = time.monotonic()
+
+    def _enabled_user_configs(self, db: Session) -> list:
+        """
+        Enabled autoscraping configs as plain rows with just the columns scheduling and status use,
+        plus the username from one outer join (None for a missing user) - no full ORM objects.
+        """
+        return db.execute(
+            select(
+                UserAutoscrapingConfig.id, UserAutoscrapingConfig.user_id, UserAutoscrapingConfig.enabled,
+                UserAutoscrapingConfig.schedule_time, UserAutoscrapingConfig.companies,
+                UserAutoscrapingConfig.search_terms, User.username
+            )
+            .outerjoin(User, User.id == UserAutoscrapingConfig.user_id)
+            .where(UserAutoscrapingConfig.enabled == True)
+        ).all()
 
     def schedule_user_autoscraping(self):
         """Set up scheduling for all enabled user-specific autoscraping configurations."""
-        db = SessionLocal()
         try:
-            # Get all enabled user autoscraping configurations
-            user_configs = db.query(UserAutoscrapingConfig).filter(
-                UserAutoscrapingConfig.enabled == True
-            ).all()
+            with SessionLocal() as db:
+                # Get all enabled user autoscraping configurations, with their usernames in the same query
+                user_configs = self._enabled_user_configs(db)
 
-            logger.info(f"🤖 Found {len(user_configs)} enabled user autoscraping configurations")
+                logger.info(f"🤖 Found {len(user_configs)} enabled user autoscraping configurations")
 
-            for config in user_configs:
-                # Schedule each user's autoscraping at their specified time
-                schedule_time = config.schedule_time or "02:00"
+                for config in user_configs:
+                    # Schedule each user's autoscraping at their specified time
+                    schedule_time = config.schedule_time or "02:00"
 
-                # Create a closure to capture the user_id for this specific schedule
-                def create_user_scraping_job(user_id: str, config_id: int):
-                    return lambda: asyncio.run(self.run_user_autoscraping(user_id, config_id))
+                    # Create a closure to capture the user_id for this specific schedule
+                    def create_user_scraping_job(user_id: str, config_id: int):
+                        return lambda: self._spawn(self.run_user_autoscraping(user_id, config_id))
 
-                schedule.every().day.at(schedule_time).do(
-                    create_user_scraping_job(config.user_id, config.id)
-                )
+                    schedule.every().day.at(schedule_time).do(
+                        create_user_scraping_job(config.user_id, config.id)
+                    )
 
-                user = db.query(User).filter(User.id == config.user_id).first()
-                username = user.username if user else f"user_{config.user_id}"
+                    username = config.username or f"user_{config.user_id}"
 
-                logger.info(f"📅 USER-SPECIFIC: {username} scheduled at {schedule_time}")
+                    logger.info("📅 USER-SPECIFIC: %s scheduled at %s", username, schedule_time)
 
-                # Log user's configuration
-                companies = config.companies or []
-                company_names = [c.get("name") for c in companies if c.get("active", True)]
-                search_terms = config.search_terms or ["software engineer"]
+                    # Log user's configuration
+                    companies = config.companies or []
+                    company_names = [c.get("name") for c in companies if c.get("active", True)]
+                    search_terms = config.search_terms or ["software engineer"]
 
-                logger.info(f"   📋 USER COMPANIES: {company_names}")
-                logger.info(f"   🔍 USER SEARCH TERMS: {search_terms}")
+                    logger.info("   📋 USER COMPANIES: %s", company_names)
+                    logger.info("   🔍 USER SEARCH TERMS: %s", search_terms)
 
         except Exception as e:
             logger.error(f"Error setting up user autoscraping schedules: {e}")
-        finally:
-            db.close()
 
     async def run_user_autoscraping(self, user_id: str, config_id: int):
         """Run autoscraping for a specific user configuration - COMPLETELY USER-SPECIFIC."""
-        db = SessionLocal()
+        username = f"user_{user_id}"
         try:
-            # Get the user's autoscraping configuration
-            config = db.query(UserAutoscrapingConfig).filter(
-                UserAutoscrapingConfig.id == config_id,
-                UserAutoscrapingConfig.user_id == user_id,
-                UserAutoscrapingConfig.enabled == True
-            ).first()
-
-            if not config:
-                logger.warning(f"User autoscraping config {config_id} for user {user_id} not found or disabled")
-                return
+            # Read the config in a short-lived session - run_targeted_scraping opens its own,
+            # so nothing here holds a connection for the length of the scrape
+            with SessionLocal() as db:
+                # Get the user's autoscraping configuration, with the username in the same query
+                row = db.execute(
+                    select(UserAutoscrapingConfig, User.username)
+                    .outerjoin(User, User.id == UserAutoscrapingConfig.user_id)
+                    .where(
+                        UserAutoscrapingConfig.id == config_id,
+                        UserAutoscrapingConfig.user_id == user_id,
+                        UserAutoscrapingConfig.enabled == True
+                    )
+                ).first()
 
-            user = db.query(User).filter(User.id == user_id).first()
-            username = user.username if user else f"user_{user_id}"
+                if not row:
+                    logger.warning(f"User autoscraping config {config_id} for user {user_id} not found or disabled")
+                    return
+
+                config, found_username = row
+                username = found_username or username
 
-            logger.info(f"🚀 STARTING USER-SPECIFIC AUTOSCRAPING for {username}")
+                logger.info(f"🚀 STARTING USER-SPECIFIC AUTOSCRAPING for {username}")
 
-            # Extract user-specific configuration (NO GLOBAL DEFAULTS)
-            companies = config.companies or []
-            company_names = [c.get("name") for c in companies if c.get("active", True)]
-            search_terms = config.search_terms or []
+                # Extract user-specific configuration (NO GLOBAL DEFAULTS)
+                companies = config.companies or []
+                company_names = [c.get("name") for c in companies if c.get("active", True)]
+                search_terms = config.search_terms or []
+                config_location = config.location
+                config_distance = config.distance
+                config_max_results = config.max_results
 
             if not company_names:
                 logger.warning(f"❌ No companies configured for user {username} - skipping")
@@ -1625,12 +2005,12 @@ Generated by JobSpy Automated Scraping System
 
             logger.info(f"🎯 USER {username}: COMPANIES = {company_names}")
             logger.info(f"🔍 USER {username}: SEARCH TERMS = {search_terms}")
-            logger.info(f"📍 USER {username}: LOCATION = {config.location or 'Not specified'}")
+            logger.info(f"📍 USER {username}: LOCATION = {config_location or 'Not specified'}")
 
             # Use user-specific scraping parameters
-            location = config.location or "USA"
-            distance = config.distance or 25
-            max_results = config.max_results or 100
+            location = config_location or "USA"
+            distance = config_distance or 25
+            max_results = config_max_results or 100
 
             logger.info(f"⚙️ USER {username}: LOCATION={location}, DISTANCE={distance}, MAX_RESULTS={max_results}")
 
@@ -1648,40 +2028,158 @@ Generated by JobSpy Automated Scraping System
 
         except Exception as e:
             logger.error(f"❌ ERROR in user autoscraping for {username}: {e}")
-        finally:
-            db.close()
     
     def _check_manual_trigger(self):
         """Check for manual trigger file to run scraping immediately."""
-        import tempfile
-        trigger_file = os.path.join(tempfile.gettempdir(), "trigger_scraping")
+        trigger_file = TRIGGER_FILE
         if os.path.exists(trigger_file):
-            logger.info("🔄 Manual trigger detected - running scraping now")
             try:
                 # Read trigger data to get specific companies/search terms
+                with open(trigger_file, 'r') as f:
+                    raw = f.read()
+
+                # An empty file (old format, e.g. `touch`) means scrape all companies
                 trigger_data = {}
-                try:
-                    with open(trigger_file, 'r') as f:
-                        import json
-                        trigger_data = json.load(f)
-                except:
-                    # Fallback for old format
-                    trigger_data = {}
+                if raw.strip():
+                    try:
+                        trigger_data = json.loads(raw)
+                    except ValueError:
+                        trigger_data = None
+                    if not isinstance(trigger_data, dict):
+                        if time.time() - os.path.getmtime(trigger_file) < TRIGGER_FILE_SETTLE_SECONDS:
+                            return  # Probably still being written - the close event or next poll picks it up
+                        logger.error(f"❌ Ignoring unreadable trigger file {trigger_file}: {raw[:200]!r}")
+                        os.remove(trigger_file)
+                        return
                 
+                logger.info("🔄 Manual trigger detected - running scraping now")
                 os.remove(trigger_file)
-                
-                # Run scraping with specific parameters if provided
-                company_names = trigger_data.get("company_names", [])
-                search_terms = trigger_data.get("search_terms", [])
-                
-                if company_names:
-                    asyncio.run(self.run_targeted_scraping(company_names, search_terms))
-                else:
-                    asyncio.run(self.run_daily_scraping())
+                self._run_trigger(trigger_data)
                     
             except Exception as e:
                 logger.error(f"Manual scraping failed: {e}")
+
+    def _run_trigger(self, trigger_data: dict):
+        """Start the scraping run a manual trigger asks for (must be called on the scheduler loop)."""
+        # Run scraping with specific parameters if provided
+        company_names = trigger_data.get("company_names", [])
+        search_terms = trigger_data.get("search_terms", [])
+
+        if company_names:
+            self._spawn(self.run_targeted_scraping(company_names, search_terms))
+        else:
+            self._spawn(self.run_daily_scraping())
+
+    async def _start_trigger_server(self):
+        """Listen on TRIGGER_SOCKET for manual triggers (one JSON line per connection)."""
+        try:
+            if os.path.exists(TRIGGER_SOCKET):
+                # Only take the path over if nobody answers - another scheduler (e.g. a second
+                # uvicorn worker) may be listening on it, and its triggers would silently stop
+                try:
+                    _, probe = await asyncio.open_unix_connection(TRIGGER_SOCKET)
+                except ConnectionRefusedError:
+                    os.unlink(TRIGGER_SOCKET)  # Stale socket from a previous run
+                except FileNotFoundError:
+                    pass
+                else:
+                    probe.close()
+                    logger.warning(f"Another scheduler is listening on {TRIGGER_SOCKET} - using the trigger file only")
+                    return
+            self._trigger_server = await asyncio.start_unix_server(self._on_trigger, path=TRIGGER_SOCKET)
+            self._trigger_socket_inode = os.stat(TRIGGER_SOCKET).st_ino
+            logger.info(f"🔌 Listening for manual triggers on {TRIGGER_SOCKET}")
+        except Exception as e:
+            logger.warning(f"Could not open trigger socket, using the trigger file only: {e}")
+
+    async def _on_trigger(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle one manual trigger sent by trigger_manual_scraping."""
+        try:
+            line = await reader.readline()
+            if not line.strip():
+                return  # Connection closed without a trigger (e.g. another scheduler probing the socket)
+            trigger_data = json.loads(line)
+            logger.info("🔄 Manual trigger received - running scraping now")
+            self._run_trigger(trigger_data)
+            writer.write(b"ok\n")
+            await writer.drain()
+        except Exception as e:
+            logger.error(f"Manual scraping failed: {e}")
+        finally:
+            writer.close()
     
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine as a task on the scheduler loop, keeping a reference until it finishes."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _scheduler_loop(self):
+        """Run due jobs, then sleep until the next one is due."""
+        logger.info("🎯 Scheduler loop started")
+        try:
+            while self.is_running:
+                schedule.run_pending()
+                # Wake at least once a minute so schedules added meanwhile are picked up
+                idle_seconds = schedule.idle_seconds()
+                sleep_seconds = 60 if idle_seconds is None else min(max(idle_seconds, 1), 60)
+                await asyncio.sleep(sleep_seconds)
+        finally:
+            logger.info("🛑 Scheduler loop stopped")
+
+    def _start_trigger_watch(self):
+        """Watch TRIGGER_FILE so a manual trigger runs right away instead of on the next poll."""
+        if Observer is None:
+            return
+
+        loop = self.loop
+        check_trigger = self._check_manual_trigger
+
+        class TriggerFileHandler(PatternMatchingEventHandler):
+            def __init__(self):
+                super().__init__(patterns=[TRIGGER_FILE], ignore_directories=True)
+
+            # on_closed (close after write) rather than on_created, which fires before anything is written
+            def on_closed(self, event):
+                loop.call_soon_threadsafe(check_trigger)
+
+            # Atomic writers (trigger_manual_scraping) rename the finished file into place
+            def on_moved(self, event):
+                loop.call_soon_threadsafe(check_trigger)
+
+        try:
+            observer = Observer()
+            observer.schedule(TriggerFileHandler(), os.path.dirname(TRIGGER_FILE), recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._trigger_observer = observer
+            logger.info(f"👀 Watching {TRIGGER_FILE} for manual triggers")
+        except Exception as e:
+            logger.warning(f"Could not watch trigger file, falling back to polling: {e}")
+
+    def _stop_trigger_watch(self):
+        """Stop the trigger file watcher if one is running."""
+        if self._trigger_observer is not None:
+            self._trigger_observer.stop()
+            self._trigger_observer.join(timeout=5)
+            self._trigger_observer = None
+
+    async def _shutdown(self):
+        """Let in-flight scraping runs finish, then stop the scheduler loop."""
+        if self._trigger_server is not None:
+            self._trigger_server.close()
+            await self._trigger_server.wait_closed()
+            self._trigger_server = None
+            # Leave the path alone if it has since been replaced by another process's socket
+            with contextlib.suppress(FileNotFoundError):
+                if os.stat(TRIGGER_SOCKET).st_ino == self._trigger_socket_inode:
+                    os.unlink(TRIGGER_SOCKET)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.wait_for_notifications()
+        asyncio.get_running_loop().stop()
+
     def start_scheduler(self):
         """Start the background scheduler."""
         if self.is_running:
@@ -1689,17 +2187,17 @@ Generated by JobSpy Automated Scraping System
             return
         
         self.is_running = True
-        self.schedule_daily_scraping()
-        
-        def run_scheduler():
-            logger.info("🎯 Scheduler thread started")
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-            logger.info("🛑 Scheduler thread stopped")
         
-        self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
+        # One long-lived event loop on its own thread runs every scheduled scrape, so the
+        # blocking parts of a run (DB, OpenAI, SMTP) never stall the API's event loop
+        self.loop = asyncio.new_event_loop()
+        self._start_trigger_watch()
+        self.schedule_daily_scraping()
+        self.scheduler_thread = threading.Thread(target=self.loop.run_forever, name="auto-scraping-scheduler", daemon=True)
         self.scheduler_thread.start()
+        self._scheduler_future = asyncio.run_coroutine_threadsafe(self._scheduler_loop(), self.loop)
+        if hasattr(socket, "AF_UNIX"):
+            asyncio.run_coroutine_threadsafe(self._start_trigger_server(), self.loop)
         
         logger.info("✅ Auto-scraping scheduler started successfully")
     
@@ -1709,52 +2207,81 @@ Generated by JobSpy Automated Scraping System
             return
         
         self.is_running = False
-        if self.scheduler_thread:
+        self._stop_trigger_watch()
+        if self.loop:
+            self._scheduler_future.cancel()
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
             self.scheduler_thread.join(timeout=5)
+            if not self.scheduler_thread.is_alive():
+                self.loop.close()
+            self.loop = None
         
         schedule.clear()
+        self._schedule_changed_at = time.monotonic()
         logger.info("🛑 Auto-scraping scheduler stopped")
     
     def get_next_run_time(self) -> Optional[datetime]:
-        """Get the next scheduled scraping time."""
-        jobs = schedule.get_jobs()
-        if jobs:
-            next_run = min(job.next_run for job in jobs if job.next_run)
-            return next_run
-        return None
+        """Get the next scheduled scraping time.
+
+        Cached until the schedule is rebuilt or the cached run time has passed
+        (schedule moves a job's next_run forward after it runs).
+        """
+        cached = self._next_run_cache
+        if cached is not None:
+            next_run, computed_at = cached
+            if computed_at >= self._schedule_changed_at and (next_run is None or next_run > datetime.now()):
+                return next_run
+
+        next_run = min((job.next_run for job in schedule.get_jobs() if job.next_run), default=None)
+        self._next_run_cache = (next_run, time.monotonic())
+        return next_run
     
+    def _active_companies_count(self, db: Session) -> int:
+        """How many companies get_active_companies returns, reused for ACTIVE_COMPANIES_CACHE_TTL seconds."""
+        cached = self._active_companies_count_cache
+        if cached and time.monotonic() - cached[0] < ACTIVE_COMPANIES_CACHE_TTL:
+            return cached[1]
+
+        count = len(self.get_active_companies(db=db))
+        self._active_companies_count_cache = (time.monotonic(), count)
+        return count
+
     def get_status(self) -> dict:
-        """Get scheduler status information."""
+        """Get scheduler status information.
+
+        Repeated polls within STATUS_CACHE_TTL get the same (read-only) dict without
+        touching the database; starting, stopping or rescheduling refreshes it.
+        """
+        cached = self._status_cache
+        if cached is not None:
+            computed_at, status = cached
+            if computed_at >= self._schedule_changed_at and time.monotonic() - computed_at < STATUS_CACHE_TTL:
+                return status
+
         next_run = self.get_next_run_time()
-        active_companies = len(self.get_active_companies())
 
-        # Get user autoscraping configurations
+        # One session for the company count and the user autoscraping configurations
         user_configs = []
-        db = SessionLocal()
-        try:
-            user_autoscraping_configs = db.query(UserAutoscrapingConfig).filter(
-                UserAutoscrapingConfig.enabled == True
-            ).all()
-
-            for config in user_autoscraping_configs:
-                user = db.query(User).filter(User.id == config.user_id).first()
-                companies = config.companies or []
-                company_names = [c.get("name") for c in companies if c.get("active", True)]
+        with SessionLocal() as db:
+            active_companies = self._active_companies_count(db)
 
-                user_configs.append({
-                    "user_id": config.user_id,
-                    "username": user.username if user else f"user_{config.user_id}",
-                    "schedule_time": config.schedule_time,
-                    "companies": company_names,
-                    "search_terms": config.search_terms or [],
-                    "enabled": config.enabled
-                })
-        except Exception as e:
-            logger.error(f"Error getting user autoscraping configs: {e}")
-        finally:
-            db.close()
+            try:
+                for config in self._enabled_user_configs(db):
+                    companies = config.companies or []
+                    company_names = [c.get("name") for c in companies if c.get("active", True)]
+
+                    user_configs.append({
+                        "user_id": config.user_id,
+                        "username": config.username or f"user_{config.user_id}",
+                        "schedule_time": config.schedule_time,
+                        "companies": company_names,
+                        "search_terms": config.search_terms or [],
+                        "enabled": config.enabled
+                    })
+            except Exception as e:
+                logger.error(f"Error getting user autoscraping configs: {e}")
 
-        return {
+        status = {
             "enabled": self.enabled,
             "running": self.is_running,
             "schedule_time": self.schedule_time,
@@ -1765,6 +2292,8 @@ Generated by JobSpy Automated Scraping System
             "default_search_terms": self.default_search_terms,
             "user_configurations": user_configs
         }
+        self._status_cache = (time.monotonic(), status)
+        return status
 
 # Global scheduler instance
 auto_scraper = AutoScrapingScheduler()
@@ -1777,20 +2306,41 @@ def stop_auto_scraping():
     """Stop the automatic scraping service."""
     auto_scraper.stop_scheduler()
 
+def _send_trigger(trigger_data: dict) -> bool:
+    """Hand a trigger straight to a running scheduler over its Unix socket."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(TRIGGER_SOCKET):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(TRIGGER_SOCKET)
+            sock.sendall(json.dumps(trigger_data).encode() + b"\n")
+            return sock.recv(16).startswith(b"ok")
+    except OSError as e:
+        logger.warning(f"Trigger socket unavailable, falling back to trigger file: {e}")
+        return False
+
 def trigger_manual_scraping(company_names=None, search_terms=None):
-    """Trigger manual scraping by creating trigger file with optional parameters."""
+    """Trigger manual scraping with optional parameters, via the scheduler socket or a trigger file."""
     try:
-        import tempfile
         trigger_data = {
             "timestamp": str(datetime.now()),
             "company_names": company_names or [],
             "search_terms": search_terms or []
         }
+
+        if _send_trigger(trigger_data):
+            if company_names:
+                logger.info(f"✅ Manual scraping triggered for companies: {', '.join(company_names)}")
+            else:
+                logger.info("✅ Manual scraping triggered for all companies")
+            return True
         
-        trigger_file = os.path.join(tempfile.gettempdir(), "trigger_scraping")
-        with open(trigger_file, "w") as f:
-            import json
+        # Write then rename so a watcher never sees a half-written trigger file
+        trigger_file = TRIGGER_FILE
+        with open(trigger_file + ".tmp", "w") as f:
             json.dump(trigger_data, f)
+        os.replace(trigger_file + ".tmp", trigger_file)
         
         if company_names:
             logger.info(f"✅ Manual scraping trigger created for companies: {', '.join(company_names)}")
@@ -9,10 +9,13 @@ import time
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection for the whole interactive session
+session = requests.Session()
+
 def get_available_companies():
     """Get list of available companies from database."""
     try:
-        response = requests.get(f"{BASE_URL}/target-companies-public")
+        response = session.get(f"{BASE_URL}/target-companies-public")
         if response.ok:
             data = response.json()
             companies = data.get('companies', [])
@@ -38,7 +41,7 @@ def trigger_targeted_scraping(company_names, search_terms=None):
         if search_terms:
             params['search_terms'] = search_terms
             
-        response = requests.post(f"{BASE_URL}/admin/scheduler/trigger", params=params)
+        response = session.post(f"{BASE_URL}/admin/scheduler/trigger", params=params)
         
         if response.ok:
             data = response.json()
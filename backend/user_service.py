@@ -1,3 +1,5 @@
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
@@ -8,58 +10,107 @@ from models import (
 )
 from auth import get_password_hash
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import List, Optional
 import uuid
 
+# Columns the list endpoints serialize (SavedJobResponse / SearchHistoryResponse).
+# Rows keep attribute access, so from_orm works on them just like on the ORM objects
+_SAVED_JOB_LIST_COLUMNS = (
+    UserSavedJob.id, UserSavedJob.user_id, UserSavedJob.job_data, UserSavedJob.notes, UserSavedJob.tags,
+    UserSavedJob.applied, UserSavedJob.applied_at, UserSavedJob.save_for_later, UserSavedJob.not_interested,
+    UserSavedJob.interview_scheduled, UserSavedJob.interview_date, UserSavedJob.application_status,
+    UserSavedJob.application_notes, UserSavedJob.follow_up_date, UserSavedJob.saved_at, UserSavedJob.updated_at
+)
+_SEARCH_HISTORY_LIST_COLUMNS = (
+    SearchHistory.id, SearchHistory.search_term, SearchHistory.sites, SearchHistory.location,
+    SearchHistory.distance, SearchHistory.job_type, SearchHistory.is_remote, SearchHistory.results_wanted,
+    SearchHistory.company_filter, SearchHistory.results_count, SearchHistory.search_duration,
+    SearchHistory.searched_at
+)
+
+# Autoscraping settings for users who haven't saved a config yet
+_DEFAULT_AUTOSCRAPING_CONFIG = MappingProxyType({
+    "enabled": False,
+    "schedule_time": "02:00",
+    "max_results": 100,
+    "days_old": 7,
+    "sites": ("indeed", "linkedin"),
+    "search_terms": ("software engineer", "product manager"),
+    "exclude_keywords": "",
+    "location": "",
+    "distance": 25,
+    "companies": (),
+    "min_relevance_score": 60,
+    "ai_enabled": True,
+    "ai_model": "gpt-4.1-nano",
+    "ai_prompt": "Evaluate job relevance for product manager/engineer/software roles.\n\nRate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant, Irrelevant",
+    "target_roles": "product manager, engineer, software developer",
+    "email_enabled": True,
+    "notification_email": "",
+    "email_on_success": True,
+    "email_on_failure": True
+})
+
+def _update_returning(db: Session, model, values: dict, *criteria):
+    """UPDATE ... RETURNING the matching ORM object in one statement (None if no row matched). Caller commits."""
+    return db.execute(
+        update(model).where(*criteria).values(**values).returning(model)
+    ).scalar_one_or_none()
+
+def _keyset_after(model, timestamp_column, user_id: str, after_id: str):
+    """
+    Rows that come after the cursor row in (timestamp DESC, id DESC) order.
+    The cursor's timestamp is read in SQL so both sides compare in the stored format
+    (SQLite keeps server_default timestamps without microseconds, a bound datetime has them).
+    """
+    cursor_ts = select(timestamp_column).where(model.user_id == user_id, model.id == after_id).scalar_subquery()
+    return or_(
+        timestamp_column < cursor_ts,
+        and_(timestamp_column == cursor_ts, model.id < after_id)
+    )
+
 class UserService:
     
     @staticmethod
     def create_user(db: Session, user_create: UserCreate) -> User:
         """Create a new user with default preferences."""
-        # Check if username or email already exists
-        existing_user = db.query(User).filter(
-            (User.username == user_create.username) | (User.email == user_create.email)
-        ).first()
-        
-        if existing_user:
-            if existing_user.username == user_create.username:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already registered"
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-        
-        # Create new user
+        # Insert straight away and let the unique indexes catch duplicates,
+        # no separate existence check (and no race between check and insert)
         hashed_password = get_password_hash(user_create.password)
         db_user = User(
+            id=str(uuid.uuid4()),  # Known up front, so the preferences row doesn't need a flush first
             username=user_create.username,
             email=user_create.email,
             hashed_password=hashed_password,
             full_name=user_create.full_name
         )
+        db.add(db_user)
+        db.add(UserPreference(user_id=db_user.id))
         
         try:
-            db.add(db_user)
-            db.flush()  # Flush to get the user ID
-            
-            # Create default preferences for the user
-            default_preferences = UserPreference(user_id=db_user.id)
-            db.add(default_preferences)
-            
             db.commit()
-            db.refresh(db_user)
-            return db_user
-            
         except IntegrityError:
             db.rollback()
+            # Only on conflict: figure out which field was taken
+            taken_username = db.query(User.id).filter(User.username == user_create.username).first()
+            if taken_username:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Username already registered"
+                )
+            if db.query(User.id).filter(User.email == user_create.email).first():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered"
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to create user"
             )
+        
+        db.refresh(db_user)
+        return db_user
     
     @staticmethod
     def get_user_by_username(db: Session, username: str) -> Optional[User]:
@@ -83,21 +134,17 @@ class UserService:
         preferences_update: UserPreferencesUpdate
     ) -> UserPreference:
         """Update user preferences."""
-        db_preferences = db.query(UserPreference).filter(UserPreference.user_id == user_id).first()
+        # Update only provided fields
+        update_data = preferences_update.dict(exclude_unset=True)
+        update_data['updated_at'] = datetime.now(timezone.utc)
         
+        db_preferences = _update_returning(db, UserPreference, update_data, UserPreference.user_id == user_id)
         if not db_preferences:
-            # Create default preferences if they don't exist
-            db_preferences = UserPreference(user_id=user_id)
+            # Create preferences with the provided fields if they don't exist
+            db_preferences = UserPreference(user_id=user_id, **update_data)
             db.add(db_preferences)
         
-        # Update only provided fields
-        update_data = preferences_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_preferences, field, value)
-        
-        db_preferences.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(db_preferences)
         return db_preferences
     
     @staticmethod
@@ -108,27 +155,29 @@ class UserService:
         job_title = job_request.job_data.get('title')
         job_company = job_request.job_data.get('company')
         
-        # Query for existing jobs by this user
-        existing_jobs = db.query(UserSavedJob).filter(UserSavedJob.user_id == user_id).all()
+        # Let the DB do the matching instead of pulling every saved job into Python.
+        # Same rules as before: URL vs URL when both have one, title + company otherwise
+        saved_url = UserSavedJob.job_data['job_url'].as_string()
+        title_company_match = and_(
+            UserSavedJob.job_data['title'].as_string() == job_title,
+            UserSavedJob.job_data['company'].as_string() == job_company
+        ) if job_title and job_company else None
         
-        for existing_job in existing_jobs:
-            existing_job_url = existing_job.job_data.get('job_url')
-            
-            # If both jobs have URLs, only check by URL (most reliable)
-            if job_url and existing_job_url:
-                if existing_job_url == job_url:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Job already saved"
-                    )
-            # Only check by title + company if at least one job lacks a URL
-            elif (job_title and job_company and 
-                  existing_job.job_data.get('title') == job_title and 
-                  existing_job.job_data.get('company') == job_company):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Job already saved"
-                )
+        if job_url:
+            duplicate = saved_url == job_url
+            if title_company_match is not None:
+                duplicate = or_(duplicate, and_(or_(saved_url.is_(None), saved_url == ''), title_company_match))
+        else:
+            duplicate = title_company_match
+        
+        if duplicate is not None and db.query(UserSavedJob.id).filter(
+            UserSavedJob.user_id == user_id,
+            duplicate
+        ).first():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Job already saved"
+            )
         
         db_job = UserSavedJob(
             user_id=user_id,
@@ -147,12 +196,21 @@ class UserService:
         db: Session, 
         user_id: str, 
         skip: int = 0, 
-        limit: int = 100
-    ) -> List[UserSavedJob]:
-        """Get user's saved jobs."""
-        return db.query(UserSavedJob).filter(
-            UserSavedJob.user_id == user_id
-        ).offset(skip).limit(limit).all()
+        limit: int = 100,
+        after_id: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Get user's saved jobs (newest first) as plain rows - list endpoints only read them, no ORM objects needed.
+        Pass the id of the last row seen to page by keyset instead of OFFSET.
+        """
+        stmt = select(*_SAVED_JOB_LIST_COLUMNS).where(UserSavedJob.user_id == user_id)
+        if after_id is not None:
+            stmt = stmt.where(_keyset_after(UserSavedJob, UserSavedJob.saved_at, user_id, after_id))
+        else:
+            stmt = stmt.offset(skip)
+        return db.execute(
+            stmt.order_by(UserSavedJob.saved_at.desc(), UserSavedJob.id.desc()).limit(limit)
+        ).all()
     
     @staticmethod
     def get_saved_job(db: Session, user_id: str, job_id: str) -> Optional[UserSavedJob]:
@@ -170,24 +228,22 @@ class UserService:
         job_update: SavedJobUpdate
     ) -> Optional[UserSavedJob]:
         """Update a saved job."""
-        db_job = db.query(UserSavedJob).filter(
+        # Update only provided fields
+        update_data = job_update.dict(exclude_unset=True)
+        now = datetime.now(timezone.utc)
+        if update_data.get('applied'):
+            update_data['applied_at'] = now
+        update_data['updated_at'] = now
+        
+        db_job = _update_returning(
+            db, UserSavedJob, update_data,
             UserSavedJob.user_id == user_id,
             UserSavedJob.id == job_id
-        ).first()
-        
+        )
         if not db_job:
             return None
         
-        # Update only provided fields
-        update_data = job_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            if field == 'applied' and value:
-                setattr(db_job, 'applied_at', datetime.now(timezone.utc))
-            setattr(db_job, field, value)
-        
-        db_job.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(db_job)
         return db_job
     
     @staticmethod
@@ -212,15 +268,31 @@ class UserService:
         
         categorized = {
             "all": all_jobs,
-            "applied": [job for job in all_jobs if job.applied],
-            "save_for_later": [job for job in all_jobs if job.save_for_later],
-            "not_interested": [job for job in all_jobs if job.not_interested],
-            "interview_scheduled": [job for job in all_jobs if job.interview_scheduled],
-            "pending": [job for job in all_jobs if not any([
-                job.applied, job.save_for_later, job.not_interested, job.interview_scheduled
-            ])]
+            "applied": [],
+            "save_for_later": [],
+            "not_interested": [],
+            "interview_scheduled": [],
+            "pending": []
         }
         
+        # One pass over the rows instead of a list comprehension per category
+        for job in all_jobs:
+            pending = True
+            if job.applied:
+                categorized["applied"].append(job)
+                pending = False
+            if job.save_for_later:
+                categorized["save_for_later"].append(job)
+                pending = False
+            if job.not_interested:
+                categorized["not_interested"].append(job)
+                pending = False
+            if job.interview_scheduled:
+                categorized["interview_scheduled"].append(job)
+                pending = False
+            if pending:
+                categorized["pending"].append(job)
+        
         return categorized
     
     @staticmethod
@@ -255,12 +327,18 @@ class UserService:
         db: Session, 
         user_id: str, 
         skip: int = 0, 
-        limit: int = 50
-    ) -> List[SearchHistory]:
-        """Get user's search history."""
-        return db.query(SearchHistory).filter(
-            SearchHistory.user_id == user_id
-        ).order_by(SearchHistory.searched_at.desc()).offset(skip).limit(limit).all()
+        limit: int = 50,
+        after_id: Optional[str] = None
+    ) -> List[Row]:
+        """Get user's search history (newest first) as plain rows, by OFFSET or by keyset after the row with after_id."""
+        stmt = select(*_SEARCH_HISTORY_LIST_COLUMNS).where(SearchHistory.user_id == user_id)
+        if after_id is not None:
+            stmt = stmt.where(_keyset_after(SearchHistory, SearchHistory.searched_at, user_id, after_id))
+        else:
+            stmt = stmt.offset(skip)
+        return db.execute(
+            stmt.order_by(SearchHistory.searched_at.desc(), SearchHistory.id.desc()).limit(limit)
+        ).all()
     
     @staticmethod
     def create_saved_search(
@@ -292,21 +370,18 @@ class UserService:
         search_update: SavedSearchUpdate
     ) -> Optional[SavedSearch]:
         """Update a saved search."""
-        db_search = db.query(SavedSearch).filter(
+        update_data = search_update.dict(exclude_unset=True)
+        update_data['updated_at'] = datetime.now(timezone.utc)
+        
+        db_search = _update_returning(
+            db, SavedSearch, update_data,
             SavedSearch.user_id == user_id,
             SavedSearch.id == search_id
-        ).first()
-        
+        )
         if not db_search:
             return None
         
-        update_data = search_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_search, field, value)
-        
-        db_search.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(db_search)
         return db_search
     
     @staticmethod
@@ -335,6 +410,24 @@ class UserService:
     @staticmethod
     def create_or_update_autoscraping_config(db: Session, user_id: str, config_data: dict) -> UserAutoscrapingConfig:
         """Create or update user's autoscraping configuration."""
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            # Single UPSERT on the unique user_id instead of SELECT + UPDATE/INSERT
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+            columns = UserAutoscrapingConfig.__table__.c
+            values = {field: value for field, value in config_data.items() if field in columns and field != 'user_id'}
+            stmt = dialect_insert(UserAutoscrapingConfig).values(user_id=user_id, **values).on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={**values, "updated_at": datetime.now(timezone.utc)}
+            ).returning(UserAutoscrapingConfig)
+            config = db.execute(stmt).scalar_one()
+            db.commit()
+            return config
+
         # Check if config already exists
         existing_config = db.query(UserAutoscrapingConfig).filter(
             UserAutoscrapingConfig.user_id == user_id
@@ -366,28 +459,11 @@ class UserService:
         config = UserService.get_autoscraping_config(db, user_id)
 
         if not config:
-            # Return default configuration if none exists
-            return {
-                "enabled": False,
-                "schedule_time": "02:00",
-                "max_results": 100,
-                "days_old": 7,
-                "sites": ["indeed", "linkedin"],
-                "search_terms": ["software engineer", "product manager"],
-                "exclude_keywords": "",
-                "location": "",
-                "distance": 25,
-                "companies": [],
-                "min_relevance_score": 60,
-                "ai_enabled": True,
-                "ai_model": "gpt-4.1-nano",
-                "ai_prompt": "Evaluate job relevance for product manager/engineer/software roles.\n\nRate as exactly one of: Highly Relevant, Somewhat Relevant, Somewhat Irrelevant, Irrelevant",
-                "target_roles": "product manager, engineer, software developer",
-                "email_enabled": True,
-                "notification_email": "",
-                "email_on_success": True,
-                "email_on_failure": True
-            }
+            # Return default configuration if none exists (fresh lists so callers can't mutate the shared defaults)
+            defaults = dict(_DEFAULT_AUTOSCRAPING_CONFIG)
+            for key in ("sites", "search_terms", "companies"):
+                defaults[key] = list(defaults[key])
+            return defaults
 
         # Convert database model to dictionary
         return {
@@ -395,8 +471,8 @@ class UserService:
             "schedule_time": config.schedule_time,
             "max_results": config.max_results,
             "days_old": config.days_old,
-            "sites": config.sites or ["indeed", "linkedin"],
-            "search_terms": config.search_terms or ["software engineer", "product manager"],
+            "sites": config.sites or list(_DEFAULT_AUTOSCRAPING_CONFIG["sites"]),
+            "search_terms": config.search_terms or list(_DEFAULT_AUTOSCRAPING_CONFIG["search_terms"]),
             "exclude_keywords": config.exclude_keywords or "",
             "location": config.location or "",
             "distance": config.distance,
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test keyset pagination of saved jobs and search history on SQLite
+
+Walks every page with the after_id cursor against a scratch SQLite database and
+checks that each row shows up exactly once, newest first.
+Usage: python test_keyset_pagination.py (or pytest)
+"""
+
+import sys
+import os
+import tempfile
+
+# Add backend directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, User, UserSavedJob, SearchHistory
+from user_service import UserService
+
+
+def _scratch_session(tmp_dir):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'paging.db')}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _seed(db, table, model, make_row, count=7):
+    """Insert rows with server_default timestamps, then spread some across older seconds (ties stay on purpose)."""
+    db.add(User(id="user-1", username="pager", email="pager@example.com", hashed_password="x"))
+    db.add(User(id="user-2", username="other", email="other@example.com", hashed_password="x"))
+    db.add_all([make_row("user-1", i) for i in range(count)] + [make_row("user-2", 99)])
+    db.commit()
+
+    ids = [row_id for (row_id,) in db.query(model.id).filter(model.user_id == "user-1").order_by(model.id)]
+    for i, row_id in enumerate(ids[:4]):
+        db.execute(text(f"UPDATE {table} SET {'saved_at' if model is UserSavedJob else 'searched_at'} = :ts WHERE id = :id"),
+                   {"ts": f"2024-01-0{1 + i // 2} 10:00:00", "id": row_id})
+    db.commit()
+    return ids
+
+
+def _walk(fetch, limit):
+    pages, after_id = [], None
+    while True:
+        page = fetch(limit, after_id)
+        if not page:
+            return pages
+        pages.append([row.id for row in page])
+        assert len(pages) < 20, "paging never finished"
+        after_id = page[-1].id
+
+
+def test_saved_jobs_keyset_walks_every_page():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _scratch_session(tmp_dir)
+        try:
+            ids = _seed(db, "user_saved_jobs", UserSavedJob,
+                        lambda user_id, i: UserSavedJob(user_id=user_id, job_data={"title": f"Job {i}"}))
+            expected = [row.id for row in UserService.get_saved_jobs(db, "user-1", limit=100)]
+            assert sorted(expected) == ids
+
+            for limit in (1, 2, 3):
+                pages = _walk(lambda n, after_id: UserService.get_saved_jobs(db, "user-1", limit=n, after_id=after_id), limit)
+                assert [row_id for page in pages for row_id in page] == expected
+        finally:
+            db.close()
+
+
+def test_search_history_keyset_walks_every_page():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = _scratch_session(tmp_dir)
+        try:
+            ids = _seed(db, "search_history", SearchHistory,
+                        lambda user_id, i: SearchHistory(user_id=user_id, search_term=f"term {i}"))
+            expected = [row.id for row in UserService.get_search_history(db, "user-1", limit=100)]
+            assert sorted(expected) == ids
+
+            for limit in (1, 2, 3):
+                pages = _walk(lambda n, after_id: UserService.get_search_history(db, "user-1", limit=n, after_id=after_id), limit)
+                assert [row_id for page in pages for row_id in page] == expected
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    print("🧪 Testing keyset pagination on SQLite...")
+    test_saved_jobs_keyset_walks_every_page()
+    print("✅ Saved jobs: every page visited once, newest first")
+    test_search_history_keyset_walks_every_page()
+    print("✅ Search history: every page visited once, newest first")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test the executive-title filter used by the filtered CSV export
+
+Usage: python test_title_exclusion.py (or pytest)
+"""
+
+import sys
+import os
+
+# Add backend directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from scheduler import _TITLE_EXCLUDE_RE
+
+EXCLUDED_TITLES = [
+    "President, North America",
+    "Director of Engineering",
+    "Associate Director, Clinical Operations",
+    "VP Product",
+    "SVP, Research",
+    "EVP Operations",
+    "AVP - Quality",
+    "Directors Program (Rotational)",
+    "Vice President, Regulatory Affairs",
+    "Vice-President Sales",
+    "Vice Presidents Council Liaison",
+    "Chief of Staff",
+    "Chiefs Office Coordinator",
+    "Head of Data",
+]
+
+KEPT_TITLES = [
+    "Software Engineer",
+    "MVP Developer",
+    "Directorate Analyst",
+    "Chiefly Remote Product Manager",
+    "Presidential Fellow",
+    "Clinical Research Associate",
+    "Headcount Planning Analyst",
+]
+
+
+def test_executive_titles_are_excluded():
+    missed = [title for title in EXCLUDED_TITLES if not _TITLE_EXCLUDE_RE.search(title)]
+    assert not missed, f"should be excluded: {missed}"
+
+
+def test_other_titles_are_kept():
+    dropped = [title for title in KEPT_TITLES if _TITLE_EXCLUDE_RE.search(title)]
+    assert not dropped, f"should be kept: {dropped}"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing executive title exclusion...")
+    test_executive_titles_are_excluded()
+    print("✅ Executive titles excluded")
+    test_other_titles_are_kept()
+    print("✅ Other titles kept")